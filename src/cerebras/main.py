@@ -3,12 +3,26 @@
 从 Cerebras 文档页面抓取模型列表
 """
 import asyncio
-import json
 import os
-import re
+
+try:
+    # regex 库与标准库 re 接口兼容；下面的单元格模式使用占有量词，
+    # 畸形 HTML 不会触发灾难性回溯（Python 3.11 起标准库 re 同样支持该语法）
+    import regex as re
+except ImportError:
+    import re
+
 from typing import List, Dict
+
+try:
+    # selectolax 的 Lexbor C 解析器解析 HTML 远快于逐单元格的正则剥离，
+    # 且天然容忍畸形 HTML，作为可选的加速路径
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 from loguru import logger
-from ..common import connect_to_browser, PAGE_LOAD_TIMEOUT, PAGE_LOAD_WAIT_TIME
+from ..common import get_shared_context, shutdown_shared_browser, write_json_file, PAGE_LOAD_TIMEOUT
 
 # 配置常量
 CEREBRAS_URL = "https://inference-docs.cerebras.ai/models/overview"
@@ -16,6 +30,235 @@ CEREBRAS_URL = "https://inference-docs.cerebras.ai/models/overview"
 OUTPUT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 CEREBRAS_MODELS_FILE = os.path.join(OUTPUT_DIR, "cerebras.json")
 
+# 回退解析路径使用的正则（模块级编译一次，避免每次调用重新查找编译缓存）
+# 一次捕获每行的前三个单元格（模型ID / 精度 / 链接），第三列可能不存在。
+# 单元格内容用"前瞻排除结束标签 + 占有量词"代替惰性 .*?：
+# 语义仍是"匹配到第一个 </td>"，但占有量词禁止回溯，畸形输入下不会退化
+_ROW_RE = re.compile(
+    r'<tr[^>]*+>\s*+<td[^>]*+>((?:(?!</td>).)*+)</td>'
+    r'\s*+<td[^>]*+>((?:(?!</td>).)*+)</td>'
+    r'(?:\s*+<td[^>]*+>((?:(?!</td>).)*+)</td>)?+',
+    re.DOTALL
+)
+_CODE_RE = re.compile(r'<code>((?:(?!</code>).)*+)</code>', re.DOTALL)
+_HF_RE = re.compile(r'Hugging\s+Face\s+Link', re.IGNORECASE)
+def _href(s: str) -> str:
+    """
+    从 HTML 片段中提取第一个 href 属性值（纯 str.find，不经过正则引擎）
+
+    参数:
+        s: 可能包含 <a href="..."> 的 HTML 片段
+
+    返回:
+        href 属性值，未找到时返回空字符串
+    """
+    i = s.find('href=')
+    if i < 0:
+        return ''
+    q = s[i + 5:i + 6]
+    if q not in ('"', "'"):
+        return ''
+    j = s.find(q, i + 6)
+    return s[i + 6:j] if j > 0 else ''
+
+
+def _strip_tags(s: str) -> str:
+    """
+    去除字符串中的 HTML 标签（单次扫描拼接，不经过正则引擎）
+
+    参数:
+        s: 可能包含 HTML 标签的字符串
+
+    返回:
+        去除标签并去掉首尾空白后的文本
+    """
+    return ''.join(chunk.split('>', 1)[-1] for chunk in s.split('<')).strip()
+
+# 定位包含 "Hugging Face Link" 列的表格行（在页面内直接筛选，避免传输整个 body）
+MODEL_TABLE_ROW_SELECTOR = "table:has(thead th:text-matches('Hugging\\s+Face\\s+Link', 'i')) tbody tr"
+# 在页面上下文中直接提取每行的模型ID、精度和链接，只回传需要的字段
+EXTRACT_ROWS_JS = """
+els => els.map(r => ({
+    id: (r.querySelector('td:nth-child(1) code')?.innerText ?? r.querySelector('td:nth-child(1)')?.innerText ?? '').trim(),
+    precision: (r.querySelector('td:nth-child(2)')?.innerText ?? '').trim(),
+    link: r.querySelector('td:nth-child(3) a')?.href ?? ''
+}))
+"""
+
+
+def _parse_models_with_selectolax(html_content: str) -> List[Dict[str, str]]:
+    """
+    用 selectolax（Lexbor C 解析器）解析模型表格
+
+    参数:
+        html_content: 包含模型表格的 HTML 片段
+
+    返回:
+        List[Dict]: 包含模型名称和ID的列表
+    """
+    # 去重：用插入有序的 dict 以模型ID为键，同时保留输出顺序
+    unique_models = {}
+
+    tree = LexborHTMLParser(html_content)
+    for table in tree.css('table'):
+        # 检查 thead 中是否包含 "Hugging Face Link"
+        thead = table.css_first('thead')
+        if not thead or not _HF_RE.search(thead.text()):
+            continue
+
+        for row in table.css('tbody tr'):
+            tds = row.css('td')
+            if len(tds) < 2:
+                continue
+
+            # 第一列：模型ID（在 <code> 标签中）
+            code = tds[0].css_first('code')
+            model_id = (code.text() if code else tds[0].text()).strip()
+            if not model_id:
+                continue
+
+            # 第二列：精度信息（FP16, FP16/FP8等）
+            precision = tds[1].text(strip=True)
+
+            # 第三列：链接（Hugging Face Link）
+            link = ""
+            if len(tds) >= 3:
+                a = tds[2].css_first('a')
+                if a:
+                    link = (a.attributes.get('href') or '').strip()
+
+            # 只保存有链接的模型（确保是 Hugging Face Link 列中的模型）
+            if not link:
+                logger.debug(f"跳过没有链接的模型: {model_id}")
+                continue
+
+            # 去重：使用模型ID作为唯一标识
+            model_key = model_id.lower()
+            if model_key in unique_models:
+                continue
+
+            model_info = {
+                "id": model_id,
+                "name": model_id  # 默认使用ID作为名称
+            }
+
+            if precision:
+                model_info["precision"] = precision
+
+            model_info["link"] = link
+
+            unique_models[model_key] = model_info
+
+    return list(unique_models.values())
+
+
+def parse_models_from_html(html_content: str) -> List[Dict[str, str]]:
+    """
+    从 HTML 片段中解析模型表格（页面内提取失败时的回退路径）
+
+    优先使用 selectolax 的 C 解析器，未安装或解析失败时回退到正则解析。
+
+    参数:
+        html_content: 包含模型表格的 HTML 片段
+
+    返回:
+        List[Dict]: 包含模型名称和ID的列表
+    """
+    if LexborHTMLParser is not None:
+        try:
+            return _parse_models_with_selectolax(html_content)
+        except Exception as e:
+            logger.warning(f"selectolax 解析失败: {str(e)}，回退到正则解析...")
+
+    if '<table' not in html_content:
+        logger.warning("在 HTML 中未找到 table 标签")
+        return []
+
+    # 按 </table> 一次切分出各表格分片（C 级 str.split），
+    # 避免对整个 HTML 运行 table 正则
+    shards = html_content.split('</table>')
+    logger.info(f"找到 {len(shards) - 1 or 1} 个表格")
+
+    # 去重：用插入有序的 dict 以模型ID为键，同时保留输出顺序
+    unique_models = {}
+
+    # 把行循环内反复访问的方法绑定为局部变量，减少每行的属性查找
+    _code_search = _CODE_RE.search
+    _dbg = logger.debug
+
+    # 遍历所有表格分片
+    for table_content in shards:
+        # 检查是否包含 "Hugging Face Link" 列
+        # 先用 C 级子串查找快速排除，只有子串未命中时才回退到容忍非常规空白的正则
+        if 'Hugging Face Link' not in table_content and not _HF_RE.search(table_content):
+            logger.debug("跳过不包含 'Hugging Face Link' 列的表格")
+            continue
+
+        logger.debug("找到包含 'Hugging Face Link' 列的表格")
+
+        # 定位 tbody 起始位置（str.find 足够，行正则只会匹配 tr/td 结构）
+        tbody_start = table_content.find('<tbody')
+        if tbody_start < 0:
+            continue
+
+        tbody_content = table_content[tbody_start:]
+
+        # 一次扫描提取每行的前三个单元格，替代 tr/td 两层嵌套 findall
+        # finditer 惰性产出匹配对象，避免把整个表格的行列表一次性物化在内存中
+        # try/except 放在整个表格的迭代外层，行处理的热路径不付异常设置成本
+        try:
+            for row_match in _ROW_RE.finditer(tbody_content):
+                id_cell = row_match.group(1)
+                precision_cell = row_match.group(2)
+                link_cell = row_match.group(3) or ''
+
+                # 第一列：模型ID（在 <code> 标签中）
+                model_id = ""
+                code_match = _code_search(id_cell)
+                if code_match:
+                    model_id = code_match.group(1).strip()
+                else:
+                    # 如果没有 code 标签，尝试直接提取文本
+                    # 移除所有 HTML 标签
+                    model_id = _strip_tags(id_cell)
+
+                if not model_id:
+                    continue
+
+                # 第二列：精度信息（FP16, FP16/FP8等）
+                # 移除 HTML 标签，但保留文本内容
+                precision = _strip_tags(precision_cell)
+
+                # 第三列：链接（Hugging Face Link）
+                link = _href(link_cell).strip() if link_cell else ""
+
+                # 只保存有链接的模型（确保是 Hugging Face Link 列中的模型）
+                if not link:
+                    _dbg(f"跳过没有链接的模型: {model_id}")
+                    continue
+
+                # 去重：模型ID已去除首尾空白，键只需小写一次
+                model_key = model_id.lower()
+                if model_key not in unique_models:
+                    model_info = {
+                        "id": model_id,
+                        "name": model_id  # 默认使用ID作为名称
+                    }
+
+                    if precision:
+                        model_info["precision"] = precision
+
+                    if link:
+                        model_info["link"] = link
+
+                    unique_models[model_key] = model_info
+
+        except Exception as e:
+            logger.warning(f"解析行数据时出错: {str(e)}")
+            continue
+
+    return list(unique_models.values())
+
 
 async def scrape_cerebras_models() -> List[Dict[str, str]]:
     """
@@ -25,154 +268,115 @@ async def scrape_cerebras_models() -> List[Dict[str, str]]:
         List[Dict]: 包含模型名称和ID的列表
     """
     models = []
-    playwright = None
-    
+    page = None
+
     try:
-        # 连接到浏览器
-        playwright, browser_context, page = await connect_to_browser()
-        if not playwright or not browser_context or not page:
+        # 获取共享的浏览器上下文并创建独立页面
+        browser_context = await get_shared_context()
+        if not browser_context:
             logger.error("无法连接到浏览器，退出")
             return []
-        
+
+        page = await browser_context.new_page()
+        page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+
         logger.info(f"正在访问: {CEREBRAS_URL}")
         try:
+            # networkidle 已保证没有在途请求，真正的就绪信号是下面的表格行选择器等待
             await page.goto(CEREBRAS_URL, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(PAGE_LOAD_WAIT_TIME)  # 等待页面完全加载
         except Exception as e:
             logger.error(f"访问页面失败: {str(e)}")
             raise
         
-        # 等待表格加载
+        # networkidle 之后表格行通常已在 DOM 中，用一次计数检查代替 15s 的选择器等待；
+        # 未就绪时短暂等待后再重试一次
         try:
-            await page.wait_for_selector("table tbody tr", timeout=15000)
-            logger.debug("找到表格行")
+            row_count = await page.locator("table tbody tr").count()
+            if row_count == 0:
+                await asyncio.sleep(0.5)
+                row_count = await page.locator("table tbody tr").count()
+            if row_count > 0:
+                logger.debug(f"找到 {row_count} 个表格行")
+            else:
+                logger.warning("未找到表格行，继续执行...")
         except Exception as e:
-            logger.warning(f"未找到表格: {str(e)}，继续执行...")
+            logger.warning(f"检查表格行失败: {str(e)}，继续执行...")
         
-        # 获取 body 标签的 outerHTML
-        logger.info("正在获取 body 标签的 outerHTML...")
-        body_outer_html = await page.evaluate("() => document.body.outerHTML")
-        
-        if not body_outer_html:
-            logger.error("未获取到 body outerHTML")
-            return []
-        
-        logger.debug(f"获取到 body outerHTML，长度: {len(body_outer_html)}")
-        
-        # 提取所有表格（table 标签）
-        table_pattern = r'<table[^>]*>(.*?)</table>'
-        table_matches = re.findall(table_pattern, body_outer_html, re.DOTALL)
-        
-        if not table_matches:
-            logger.warning("在 body outerHTML 中未找到 table 标签")
-            return []
-        
-        logger.info(f"找到 {len(table_matches)} 个表格")
-        
-        seen_models = set()
-        
-        # 遍历所有表格
-        for table_content in table_matches:
-            # 检查 thead 中是否包含 "Hugging Face Link"
-            thead_match = re.search(r'<thead[^>]*>(.*?)</thead>', table_content, re.DOTALL)
-            if not thead_match:
-                continue
-            
-            thead_content = thead_match.group(1)
-            # 检查是否包含 "Hugging Face Link" 或 "Hugging Face" 相关文本
-            if not re.search(r'Hugging\s+Face\s+Link', thead_content, re.IGNORECASE):
-                logger.debug("跳过不包含 'Hugging Face Link' 列的表格")
-                continue
-            
-            logger.debug("找到包含 'Hugging Face Link' 列的表格")
-            
-            # 提取 tbody 内容
-            tbody_match = re.search(r'<tbody[^>]*>(.*?)</tbody>', table_content, re.DOTALL)
-            if not tbody_match:
-                continue
-            
-            tbody_content = tbody_match.group(1)
-            
-            # 提取所有 tr 标签
-            tr_pattern = r'<tr[^>]*>(.*?)</tr>'
-            tr_matches = re.findall(tr_pattern, tbody_content, re.DOTALL)
-            
-            for tr_content in tr_matches:
-                try:
-                    # 提取所有 td 标签
-                    td_pattern = r'<td[^>]*>(.*?)</td>'
-                    td_matches = re.findall(td_pattern, tr_content, re.DOTALL)
-                    
-                    if len(td_matches) < 2:
-                        continue
-                    
-                    # 第一列：模型ID（在 <code> 标签中）
-                    model_id = ""
-                    code_match = re.search(r'<code>(.*?)</code>', td_matches[0], re.DOTALL)
-                    if code_match:
-                        model_id = code_match.group(1).strip()
-                    else:
-                        # 如果没有 code 标签，尝试直接提取文本
-                        # 移除所有 HTML 标签
-                        model_id = re.sub(r'<[^>]+>', '', td_matches[0]).strip()
-                    
-                    if not model_id:
-                        continue
-                    
-                    # 第二列：精度信息（FP16, FP16/FP8等）
-                    precision = ""
-                    if len(td_matches) >= 2:
-                        # 移除 HTML 标签，但保留文本内容
-                        precision = re.sub(r'<[^>]+>', '', td_matches[1]).strip()
-                    
-                    # 第三列：链接（Hugging Face Link）
-                    link = ""
-                    if len(td_matches) >= 3:
-                        link_match = re.search(r'<a[^>]*href=["\']([^"\']+)["\']', td_matches[2])
-                        if link_match:
-                            link = link_match.group(1).strip()
-                    
-                    # 只保存有链接的模型（确保是 Hugging Face Link 列中的模型）
-                    if not link:
-                        logger.debug(f"跳过没有链接的模型: {model_id}")
-                        continue
-                    
-                    # 去重：使用模型ID作为唯一标识
-                    model_key = model_id.lower().strip()
-                    if model_key and model_key not in seen_models:
-                        seen_models.add(model_key)
-                        
-                        model_info = {
-                            "id": model_id,
-                            "name": model_id  # 默认使用ID作为名称
-                        }
-                        
-                        if precision:
-                            model_info["precision"] = precision
-                        
-                        if link:
-                            model_info["link"] = link
-                        
-                        models.append(model_info)
-                        
-                except Exception as e:
-                    logger.warning(f"解析行数据时出错: {str(e)}")
+        # 在页面上下文中直接查询目标表格的行，只回传模型ID、精度和链接
+        # （避免将整个 body outerHTML 传回 Python 再做多轮正则解析）
+        rows = []
+        try:
+            logger.info("正在从页面中提取模型表格行...")
+            rows = await page.eval_on_selector_all(MODEL_TABLE_ROW_SELECTOR, EXTRACT_ROWS_JS)
+            logger.debug(f"从页面中提取到 {len(rows)} 行")
+        except Exception as e:
+            logger.warning(f"页面内提取表格行失败: {str(e)}，回退到 HTML 解析...")
+
+        if rows:
+            # 去重：用插入有序的 dict 以模型ID为键，同时保留输出顺序
+            unique_models = {}
+
+            for row in rows:
+                model_id = (row.get("id") or "").strip()
+                link = (row.get("link") or "").strip()
+
+                if not model_id:
                     continue
-        
+
+                # 只保存有链接的模型（确保是 Hugging Face Link 列中的模型）
+                if not link:
+                    logger.debug(f"跳过没有链接的模型: {model_id}")
+                    continue
+
+                # 模型ID已去除首尾空白，键只需小写一次
+                model_key = model_id.lower()
+                if model_key in unique_models:
+                    continue
+
+                model_info = {
+                    "id": model_id,
+                    "name": model_id  # 默认使用ID作为名称
+                }
+
+                precision = (row.get("precision") or "").strip()
+                if precision:
+                    model_info["precision"] = precision
+
+                model_info["link"] = link
+
+                unique_models[model_key] = model_info
+
+            models = list(unique_models.values())
+        else:
+            # 回退路径：只取目标表格的 outerHTML 并用正则解析
+            # （在页面内按 thead 文本过滤，避免把整个 body 序列化回 Python）
+            logger.info("正在获取目标表格的 outerHTML...")
+            target_html = await page.evaluate(
+                """() => Array.from(document.querySelectorAll('table'))
+                    .filter(t => /Hugging\\s+Face\\s+Link/i.test(t.tHead ? t.tHead.innerText : ''))
+                    .map(t => t.outerHTML)
+                    .join('')"""
+            )
+
+            if not target_html:
+                logger.error("未获取到目标表格的 outerHTML")
+                return []
+
+            logger.debug(f"获取到目标表格 HTML，长度: {len(target_html)}")
+            models = parse_models_from_html(target_html)
+
         logger.info(f"成功提取 {len(models)} 个模型")
         
     except Exception as e:
-        logger.error(f"抓取 Cerebras 模型列表时出错: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"抓取 Cerebras 模型列表时出错: {str(e)}")
         return []
     finally:
-        # 通过 CDP 连接时，只停止 playwright 实例，不关闭浏览器
-        if playwright:
+        # 只关闭本任务的页面，共享的 playwright 实例由 shutdown_shared_browser 统一停止
+        if page:
             try:
-                await playwright.stop()
+                await page.close()
             except Exception as e:
-                logger.warning(f"停止 playwright 时出错: {e}")
+                logger.warning(f"关闭页面时出错: {e}")
     
     return models
 
@@ -197,9 +401,8 @@ async def main():
                         "models": cerebras_models
                     }
                     
-                    with open(CEREBRAS_MODELS_FILE, "w", encoding="utf-8") as f:
-                        json.dump(output_data, f, ensure_ascii=False, indent=2)
-                    
+                    write_json_file(CEREBRAS_MODELS_FILE, output_data)
+
                     logger.success(f"成功保存 {len(cerebras_models)} 个 Cerebras 模型信息到 {CEREBRAS_MODELS_FILE}")
                     
                     # 打印统计信息
@@ -226,20 +429,24 @@ async def main():
             else:
                 logger.warning("未提取到 Cerebras 模型数据")
         except Exception as e:
-            logger.error(f"抓取 Cerebras 模型失败: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"抓取 Cerebras 模型失败: {str(e)}")
             raise
         
     except KeyboardInterrupt:
         logger.warning("\n用户中断程序")
         raise
     except Exception as e:
-        logger.error(f"程序执行失败: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"程序执行失败: {str(e)}")
         raise
 
 
+async def _standalone():
+    """单独运行本模块时，结束后停止共享的 playwright 实例"""
+    try:
+        await main()
+    finally:
+        await shutdown_shared_browser()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_standalone())
@@ -2,13 +2,69 @@
 """
 共享工具模块
 """
+import asyncio
+import json
+import os
+import re
 import sys
 from typing import List, Dict, Optional, Tuple
+
+try:
+    # orjson 的 C 编码器比标准库 json 快约 5 倍，且直接输出 UTF-8 字节
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _disable_playwright_stack_capture():
+    """
+    关闭 Playwright 每次 API 调用的调用栈采集
+
+    Playwright 为了生成调试信息，在每个 API 调用（goto/evaluate/wait_for_selector 等）
+    都会采集 Python 调用栈，在抓取类负载中该开销可占 CPU 的 ~25%。
+    设置环境变量 PW_INSPECT_STACK=1 可恢复默认的采集行为。
+
+    只替换当前安装版本中实际存在的栈采集入口函数，不动 _connection 模块
+    引用的 inspect 模块本身（新版 playwright 在采集路径上还会调用
+    inspect.currentframe 等其他成员）。打补丁后立即冒烟调用一次，
+    有任何异常就整体回滚，保证补丁失败时回到默认行为。
+    """
+    try:
+        from playwright._impl import _connection as _pw_connection
+    except Exception:
+        return
+
+    # 各版本的栈采集入口名不同：旧版是 _extract_stack_trace_information_from_stack，
+    # 新版是 wrap_api_call 每次调用的 _capture_stack_trace
+    def _stub(*args, **kwargs):
+        return {"allFrames": [], "frames": [], "apiName": ""}
+
+    originals = {}
+    try:
+        for name in ("_extract_stack_trace_information_from_stack", "_capture_stack_trace"):
+            if hasattr(_pw_connection, name):
+                originals[name] = getattr(_pw_connection, name)
+                setattr(_pw_connection, name, _stub)
+        if not originals:
+            return
+        # 冒烟测试：补丁后的入口必须可调用成功，否则回滚
+        for name in originals:
+            getattr(_pw_connection, name)()
+    except Exception:
+        for name, original in originals.items():
+            setattr(_pw_connection, name, original)
+
+
+if os.environ.get("PW_INSPECT_STACK", "0") != "1":
+    _disable_playwright_stack_capture()
+
 from playwright.async_api import async_playwright, BrowserContext, Page, Playwright
 from loguru import logger
 
 # 配置常量
 CDP_ENDPOINT = "http://localhost:9222"
+# 从上下文字符串中提取数字部分（模块级编译一次）
+_CONTEXT_DIGITS_RE = re.compile(r'\d+')
 PAGE_LOAD_TIMEOUT = 60000
 PAGE_LOAD_WAIT_TIME = 5
 
@@ -22,13 +78,88 @@ logger.add(
 )
 
 
-async def connect_to_browser(cdp_endpoint: str = CDP_ENDPOINT) -> Tuple[Optional[Playwright], Optional[BrowserContext], Optional[Page]]:
+# 共享的 playwright 实例与浏览器上下文（三个抓取任务复用同一个 CDP 连接，
+# 避免各自启动 playwright 子进程并重复进行 CDP 握手）
+_PW_SINGLETON: Optional[Tuple[Playwright, BrowserContext]] = None
+# 三个抓取任务并发首次调用时，锁保证只有一个去建立连接，其余等待复用
+_PW_LOCK = asyncio.Lock()
+
+
+async def get_shared_context(cdp_endpoint: str = CDP_ENDPOINT) -> Optional[BrowserContext]:
+    """
+    获取共享的浏览器上下文（懒加载，进程内只建立一次 CDP 连接）
+
+    各抓取任务应通过 browser_context.new_page() 创建自己的页面并在结束时关闭页面；
+    playwright 实例统一由 shutdown_shared_browser() 停止。
+
+    参数:
+        cdp_endpoint: CDP 端点地址
+
+    返回:
+        共享的 BrowserContext，连接失败时返回 None
+    """
+    global _PW_SINGLETON
+
+    if _PW_SINGLETON is not None:
+        return _PW_SINGLETON[1]
+
+    async with _PW_LOCK:
+        # 等锁期间可能已有任务完成了初始化，拿到锁后先复查
+        if _PW_SINGLETON is not None:
+            return _PW_SINGLETON[1]
+
+        playwright = None
+        try:
+            logger.info(f"正在通过 CDP 连接到本地浏览器 ({cdp_endpoint})...")
+            playwright = await async_playwright().start()
+            playwright_instance = await playwright.chromium.connect_over_cdp(cdp_endpoint)
+
+            if not playwright_instance.contexts:
+                logger.error("浏览器没有可用的上下文")
+                await playwright.stop()
+                return None
+
+            _PW_SINGLETON = (playwright, playwright_instance.contexts[0])
+            return _PW_SINGLETON[1]
+
+        except Exception as e:
+            logger.error(f"连接浏览器失败: {str(e)}")
+            logger.error("请确保浏览器已启动并开启了远程调试端口: chrome --remote-debugging-port=9222")
+            if playwright:
+                try:
+                    await playwright.stop()
+                except Exception:
+                    pass
+            return None
+
+
+async def shutdown_shared_browser() -> None:
+    """
+    停止共享的 playwright 实例
+
+    通过 CDP 连接时不会关闭浏览器本身，只释放本进程的连接。
+    """
+    global _PW_SINGLETON
+
+    if _PW_SINGLETON is None:
+        return
+
+    playwright, _ = _PW_SINGLETON
+    _PW_SINGLETON = None
+    try:
+        await playwright.stop()
+    except Exception as e:
+        logger.warning(f"停止 playwright 时出错: {e}")
+
+
+async def connect_to_browser(cdp_endpoint: str = CDP_ENDPOINT, new_page: bool = False) -> Tuple[Optional[Playwright], Optional[BrowserContext], Optional[Page]]:
     """
     通过 CDP 连接到本地浏览器
-    
+
     参数:
         cdp_endpoint: CDP 端点地址
-        
+        new_page: 是否强制创建独立的新页面（并发抓取时各任务需要独立页面，避免争用同一标签页）
+
     返回:
         (playwright, browser_context, page) 元组，如果连接失败则返回 (None, None, None)
     """
@@ -47,6 +178,12 @@ async def connect_to_browser(cdp_endpoint: str = CDP_ENDPOINT) -> Tuple[Optional
         browser_context = playwright_instance.contexts[0]
         
         # 获取现有页面或创建新页面
+        if new_page:
+            page = await browser_context.new_page()
+            logger.info("创建独立的新页面")
+            page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+            return playwright, browser_context, page
+
         valid_pages = [p for p in browser_context.pages if not p.is_closed()]
         if valid_pages:
             page = valid_pages[0]
@@ -69,6 +206,26 @@ async def connect_to_browser(cdp_endpoint: str = CDP_ENDPOINT) -> Tuple[Optional
         return None, None, None
 
 
+def write_json_file(file_path: str, data: Dict) -> None:
+    """
+    将数据以带缩进的 JSON 格式写入文件
+
+    优先使用 orjson（C 编码器，直接输出 UTF-8 字节），未安装时回退到标准库 json。
+
+    参数:
+        file_path: 输出文件路径
+        data: 要序列化的数据
+    """
+    # 两条路径都先在内存中编码完毕，再用大缓冲一次性写出，
+    # 避免 json.dump 按缩进逐段 write 产生成千上万次小写入
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(file_path, "wb", buffering=1 << 20) as f:
+        f.write(encoded)
+
+
 def validate_and_clean_models(models: List[Dict]) -> List[Dict[str, str]]:
     """
     验证和清理模型数据
@@ -79,8 +236,6 @@ def validate_and_clean_models(models: List[Dict]) -> List[Dict[str, str]]:
     返回:
         清理后的模型数据列表
     """
-    import re
-    
     validated_models = []
     seen_models = set()
     
@@ -95,8 +250,8 @@ def validate_and_clean_models(models: List[Dict]) -> List[Dict[str, str]]:
         if not model_name and not model_id:
             continue
         
-        # 使用ID作为唯一标识，如果没有ID则使用名称
-        model_key = (model_id or model_name).lower()
+        # 使用ID作为唯一标识，如果没有ID则使用名称（casefold 每行只计算一次）
+        model_key = (model_id or model_name).casefold()
         if not model_key or model_key in seen_models:
             continue
         seen_models.add(model_key)
@@ -105,9 +260,9 @@ def validate_and_clean_models(models: List[Dict]) -> List[Dict[str, str]]:
         context = str(model.get("context", "")).strip()
         if context:
             # 提取数字部分
-            context_match = re.search(r'(\d+)', context)
+            context_match = _CONTEXT_DIGITS_RE.search(context)
             if context_match:
-                context = context_match.group(1)
+                context = context_match.group(0)
             else:
                 context = ""
         
@@ -15,6 +15,7 @@ if str(project_root) not in sys.path:
 from loguru import logger
 
 # 导入各个提供商的模块
+from src.common import shutdown_shared_browser
 from src.openrouter.main import main as openrouter_main
 from src.cerebras.main import main as cerebras_main
 from src.modelscope.main import main as modelscope_main
@@ -23,49 +24,33 @@ from src.modelscope.main import main as modelscope_main
 async def main():
     """主函数"""
     try:
-        # 抓取 OpenRouter 免费文本到文本模型信息
+        # 并发抓取三个提供商的模型信息
+        # 三个抓取任务都是网络 I/O 密集型，并发执行后总耗时从三者之和降为三者最大值
         logger.info("=" * 60)
-        logger.info("开始抓取 OpenRouter 免费文本到文本模型信息")
+        logger.info("开始并发抓取 OpenRouter / Cerebras / ModelScope 模型信息")
         logger.info("=" * 60)
-        
-        try:
-            await openrouter_main()
-        except Exception as e:
-            logger.error(f"抓取 OpenRouter 模型失败: {str(e)}")
-            logger.info("继续执行其他任务...")
-        
-        # 抓取 Cerebras 模型列表
-        logger.info("\n" + "=" * 60)
-        logger.info("开始抓取 Cerebras 模型列表")
-        logger.info("=" * 60)
-        
-        try:
-            await cerebras_main()
-        except Exception as e:
-            logger.error(f"抓取 Cerebras 模型失败: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        # 抓取 ModelScope 模型列表
-        logger.info("\n" + "=" * 60)
-        logger.info("开始抓取 ModelScope 模型列表")
-        logger.info("=" * 60)
-        
-        try:
-            await modelscope_main()
-        except Exception as e:
-            logger.error(f"抓取 ModelScope 模型失败: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
+
+        provider_names = ["OpenRouter", "Cerebras", "ModelScope"]
+        results = await asyncio.gather(
+            openrouter_main(),
+            cerebras_main(),
+            modelscope_main(),
+            return_exceptions=True
+        )
+
+        for provider_name, result in zip(provider_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"抓取 {provider_name} 模型失败: {str(result)}")
+
     except KeyboardInterrupt:
         logger.warning("\n用户中断程序")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"程序执行失败: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"程序执行失败: {str(e)}")
         sys.exit(1)
+    finally:
+        # 统一停止三个抓取任务共享的 playwright 实例
+        await shutdown_shared_browser()
 
 
 if __name__ == "__main__":
@@ -3,13 +3,138 @@
 从 ModelScope HTML 页面获取模型列表
 """
 import asyncio
+import hashlib
 import json
+import mmap
 import os
 import re
 import urllib.parse
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
-from ..common import connect_to_browser, PAGE_LOAD_TIMEOUT, PAGE_LOAD_WAIT_TIME
+from ..common import get_shared_context, shutdown_shared_browser, write_json_file, PAGE_LOAD_TIMEOUT, PAGE_LOAD_WAIT_TIME
+
+try:
+    # selectolax 的 Lexbor C 解析器对每张卡片只建一次树，
+    # 替代逐字段的多遍正则全文扫描；未安装时回退到正则提取
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Hyperscan 的向量化多模式扫描吞吐量远高于逐字符的自动机，
+    # 作为任务关键词匹配的首选；未安装时回退到 pyahocorasick / 正则
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # pyahocorasick 的 C 自动机对全部任务关键词只做一次线性扫描，
+    # 替代逐关键词的 re.finditer 加 Python 层的重叠检查；未安装时回退
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # xxhash 的 C 实现比 SHA 系列快一个数量级，用作解析缓存的键
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# 模型卡片解析使用的正则（模块级编译一次，每张卡片直接复用编译好的 Pattern 对象）
+_RE_HREF = re.compile(r'href=["\']([^"\']+)["\']')
+_RE_C4 = re.compile(r'c4=([^&]+)')
+_RE_TITLE_MS = re.compile(r'<span[^>]*class="[^"]*ms-title-font[^"]*"[^>]*>(.*?)</span>', re.DOTALL)
+_RE_TITLE_SPAN = re.compile(r'<span[^>]*class="[^"]*title[^"]*"[^>]*>(.*?)</span>', re.DOTALL)
+_RE_TITLE_DIV = re.compile(r'<div[^>]*class="[^"]*title[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_RE_DESC = re.compile(r'<div[^>]*class="[^"]*desc[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_RE_TAG_STRIP = re.compile(r'<[^>]+>')
+_RE_CJK = re.compile(r'[\u4e00-\u9fff]+')
+# 时间 / 下载量 / 收藏数：一个合并的交替模式按图标 id 分派，一次 finditer 同时提取三个字段
+_RE_META = re.compile(
+    r'#icon-(?P<kind>maasshijian-time-line1|maasa-zhuangtai216x16|maasa-shoucangzhuangtai216x16)'
+    r'"[^>]*>.*?</use>.*?</svg>.*?</span>(?P<val>[^<]+)</div>',
+    re.DOTALL
+)
+# 图标 id 到模型信息字段名的映射
+_META_ICON_FIELDS = {
+    'maasshijian-time-line1': 'time',
+    'maasa-zhuangtai216x16': 'downloads',
+    'maasa-shoucangzhuangtai216x16': 'stars',
+}
+# 带可选 K/M/B 单位的数量（如 "19.3k"、"5"）
+_RE_NUM = re.compile(r'([\d.]+)\s*([KkMmBb]?)')
+# K/M/B 数量单位对应的倍数（空字符串表示无单位）
+_COUNT_MULT = {'': 1, 'K': 1000, 'M': 1000000, 'B': 1000000000}
+# 模型卡片 <a> 标签（parse_html_file 的非分隔符路径使用）。
+# 上面的图标/class 模式匹配的是稳定小写的机器生成 HTML，不加 IGNORECASE；
+# 这里属性名与顺序可能变化，保留 IGNORECASE 以防万一
+_RE_MODEL_CARD = re.compile(r'<a[^>]*data-autolog[^>]*c3=modelCard[^>]*>.*?</a>', re.DOTALL | re.IGNORECASE)
+
+# 常见的任务类型关键词（按长度从长到短排序，优先匹配更具体的）
+# 同时支持"文字"和"文本"两种写法
+_TASK_KEYWORDS = [
+    '文字生成图片', '文本生成图片', '文字生成视频', '文本生成视频',
+    '视觉多模态理解', '统一多模态', '文本到图像', '图像到文本',
+    '文字生成', '文本生成', '图像描述', '语音合成',
+    '图像分类', '目标检测', '视频生成', '音频生成', '多模态理解'
+]
+# 中文名称回退路径用于 O(1) 排除任务关键词的集合
+_TASK_KWS = frozenset(_TASK_KEYWORDS)
+# 关键词边界允许的中文标点
+_CJK_PUNCT = frozenset('，。、；：！？')
+# 回退路径使用的合并交替模式：按长度降序排列关键词（同一起始位置优先取长的），
+# 并用环视排除非法边界（边界与 _is_boundary_char 一致：允许空白、中文标点、汉字或文本两端）
+_RE_TASKS = re.compile(
+    r'(?<![^\s，。、；：！？\u4e00-\u9fff])'
+    + '(?:' + '|'.join(sorted(_TASK_KEYWORDS, key=len, reverse=True)) + ')'
+    + r'(?![^\s，。、；：！？\u4e00-\u9fff])'
+)
+
+if ahocorasick is not None:
+    # 导入时构建一次 Aho–Corasick 自动机，所有关键词一次扫描全部命中
+    _TASK_AC = ahocorasick.Automaton()
+    for _kw in _TASK_KEYWORDS:
+        _TASK_AC.add_word(_kw, _kw)
+    _TASK_AC.make_automaton()
+else:
+    _TASK_AC = None
+
+if hyperscan is not None:
+    # 导入时编译一次 Hyperscan 多模式数据库；关键词是 UTF-8 字节模式，
+    # 编译失败（平台不支持等）时置空并回退到 Aho–Corasick / 正则
+    try:
+        _TASK_HS = hyperscan.Database()
+        _TASK_HS.compile(
+            expressions=[_kw.encode('utf-8') for _kw in _TASK_KEYWORDS],
+            ids=list(range(len(_TASK_KEYWORDS))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_TASK_KEYWORDS),
+        )
+    except Exception:
+        _TASK_HS = None
+else:
+    _TASK_HS = None
+
+# 解析工作进程池（懒创建；解析是 CPU 密集型，放到子进程可与下一页的网络等待重叠）
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """获取解析工作进程池（首次调用时创建）"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=2)
+    return _PARSE_POOL
+
+
+def _shutdown_parse_pool() -> None:
+    """关闭解析工作进程池（抓取结束后调用）"""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(wait=True)
+        _PARSE_POOL = None
+
 
 # 配置常量
 MODELSCOPE_BASE_URL = "https://modelscope.cn/models?filter=inference_type&sort=downloads&tabKey=task"
@@ -18,305 +143,562 @@ MODELSCOPE_PAGES = 5  # 抓取第 1-5 页
 OUTPUT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "modelscope.json")
 RAW_HTML_FILE = "/tmp/modelscope.html"
+# 解析缓存放在用户缓存目录并用 JSON 序列化（缓存值只有 str/int，
+# 不用 pickle，避免反序列化共享路径下被篡改文件的风险）
+PARSE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "modelscope_parse_cache.json")
+# 模型块分隔符（页面内拼接与 HTML 文件解析共用同一个哨兵）
+MODEL_BLOCK_SEPARATOR = "<!-- ===== MODEL BLOCK SEPARATOR ===== -->"
+_SEPARATOR_BYTES = MODEL_BLOCK_SEPARATOR.encode("utf-8")
+# 页面内结构化提取脚本：直接在浏览器 DOM 中取出各字段，
+# CDP 只传输小的字段字典而不是整段卡片 HTML，Python 端无需再解析 HTML
+_EXTRACT_CARDS_JS = """
+() => Array.from(document.querySelectorAll('a[data-autolog*="c3=modelCard"]')).map(link => {
+    const iconText = id => {
+        for (const use of link.querySelectorAll('use')) {
+            const href = use.getAttribute('xlink:href') || use.getAttribute('href');
+            if (href === '#' + id) {
+                const div = use.closest('div');
+                return div ? div.textContent : null;
+            }
+        }
+        return null;
+    };
+    return {
+        href: link.getAttribute('href'),
+        autolog: link.getAttribute('data-autolog'),
+        title: (link.querySelector('span.ms-title-font')
+                || link.querySelector('span[class*="title"]')
+                || link.querySelector('div[class*="title"]'))?.textContent ?? null,
+        desc: link.querySelector('[class*="desc"]')?.textContent ?? null,
+        time: iconText('icon-maasshijian-time-line1'),
+        downloads: iconText('icon-maasa-zhuangtai216x16'),
+        stars: iconText('icon-maasa-shoucangzhuangtai216x16'),
+        text: link.textContent
+    };
+})
+"""
+
+# 语言切换按钮的 JS 回退脚本（模块级常量，避免每次运行重新拼接 ~5 KB 字符串）
+_LANG_TOGGLE_JS = """
+    () => {
+        // 查找所有 use 元素，检查 xlink:href 属性（避免使用无效的 CSS 选择器）
+        const allUses = document.querySelectorAll('use');
+        let targetUse = null;
+        
+        for (let use of allUses) {
+            const href = use.getAttribute('xlink:href') || use.getAttribute('href');
+            if (href && href === '#icon-maaszhongyingzhuanhuan-CN-EN-line') {
+                targetUse = use;
+                break;
+            }
+        }
+        
+        if (!targetUse) {
+            return false;
+        }
+        
+        // 找到包含该 use 的 SVG 元素
+        const svgElement = targetUse.closest('svg');
+        if (!svgElement) {
+            return false;
+        }
+        
+        // 查找 SVG 的父元素（可能是 button、a 或其他可点击元素）
+        let clickable = svgElement.closest('button') || 
+                        svgElement.closest('a') || 
+                        svgElement.closest('[role="button"]') ||
+                        svgElement.closest('div[onclick]') ||
+                        svgElement.closest('[data-spm-anchor-id]')?.parentElement ||
+                        svgElement.parentElement;
+        
+        if (clickable) {
+            // 尝试多种点击方式
+            try {
+                clickable.click();
+                return true;
+            } catch (e) {
+                // 如果 click() 失败，尝试 dispatchEvent
+                try {
+                    const clickEvent = new MouseEvent('click', {
+                        bubbles: true,
+                        cancelable: true,
+                        view: window
+                    });
+                    clickable.dispatchEvent(clickEvent);
+                    return true;
+                } catch (e2) {
+                    return false;
+                }
+            }
+        }
+        
+        // 如果找不到父元素，尝试向上查找
+        let element = svgElement;
+        for (let i = 0; i < 5; i++) {
+            element = element.parentElement;
+            if (!element) break;
+            
+            // 检查是否是 button、a 或其他可点击元素
+            if (element.tagName === 'BUTTON' || 
+                element.tagName === 'A' || 
+                element.getAttribute('role') === 'button' ||
+                element.onclick ||
+                element.getAttribute('data-spm-anchor-id') ||
+                element.style.cursor === 'pointer') {
+                try {
+                    element.click();
+                    return true;
+                } catch (e) {
+                    try {
+                        const clickEvent = new MouseEvent('click', {
+                            bubbles: true,
+                            cancelable: true,
+                            view: window
+                        });
+                        element.dispatchEvent(clickEvent);
+                        return true;
+                    } catch (e2) {
+                        continue;
+                    }
+                }
+            }
+        }
+        
+        return false;
+    }
+"""
+
+
+# 跨运行的解析缓存：增量运行中头部模型卡片基本不变，命中时直接跳过解析。
+# 键用稳定的内容哈希（内置 hash() 每个进程加盐，不能做持久化键）。
+# 卡片 HTML 里嵌着会变化的下载量/星标数，计数一变键就换，旧键不会再命中，
+# 所以必须限制条目数：按插入序当 LRU 用，命中时把键挪到末尾，
+# 落盘前丢掉超出上限的最旧条目。上限取每次运行新增条目数（约 180）的十几倍。
+_PARSE_CACHE_MAX = 2000
+_PARSE_CACHE: Dict[str, Dict[str, Any]] = {}
+try:
+    with open(PARSE_CACHE_FILE, "r", encoding="utf-8") as _cache_f:
+        _PARSE_CACHE = json.load(_cache_f)
+    if not isinstance(_PARSE_CACHE, dict):
+        _PARSE_CACHE = {}
+except FileNotFoundError:
+    pass
+except Exception:
+    # 缓存文件损坏时直接丢弃，从空缓存开始
+    _PARSE_CACHE = {}
+
+
+def _card_hash(link_html: str) -> str:
+    """计算卡片 HTML 的缓存键（优先 xxhash 的 C 实现，未安装时用 blake2b）"""
+    data = link_html.encode("utf-8", errors="replace")
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def save_parse_cache() -> None:
+    """把解析缓存写回磁盘（main 结束时调用），超出上限时先淘汰最旧条目"""
+    try:
+        # dict 保持插入序，本次运行命中/新增的键都在末尾，开头即最旧
+        for key in list(_PARSE_CACHE)[:len(_PARSE_CACHE) - _PARSE_CACHE_MAX]:
+            del _PARSE_CACHE[key]
+        os.makedirs(os.path.dirname(PARSE_CACHE_FILE), exist_ok=True)
+        with open(PARSE_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_PARSE_CACHE, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning(f"写入解析缓存失败: {e}")
+
+
+def _parse_count(text: str) -> Optional[int]:
+    """
+    解析带 K/M/B 单位的数量字符串（如 "19.3k" -> 19300）
+
+    参数:
+        text: 数量字符串，单位不区分大小写
+
+    返回:
+        解析出的整数，无法解析时返回 None
+    """
+    # fullmatch：带逗号等多余字符的文本（如 "12,345"）视为无法解析，
+    # 与原先 int(float(...)) 抛 ValueError 后不设字段的行为一致
+    match = _RE_NUM.fullmatch(text.strip())
+    if not match:
+        return None
+
+    num, unit = match.groups()
+    try:
+        # Decimal 做精确十进制运算，避免 1.15k 这类值的浮点舍入误差
+        return int(Decimal(num) * _COUNT_MULT[unit.upper()])
+    except InvalidOperation:
+        return None
+
+
+def _apply_href_fields(model_info: Dict[str, Any], href: str) -> None:
+    """根据 href 属性填充 link / id / organization 字段"""
+    if not href:
+        return
+    # 如果是相对路径，转换为完整 URL
+    if href.startswith("/models/"):
+        model_info["link"] = f"https://modelscope.cn{href}"
+        model_path = href.replace("/models/", "")
+        model_info["id"] = model_path
+        # 提取组织名称
+        parts = model_path.split("/")
+        if len(parts) >= 2:
+            model_info["organization"] = parts[0]
+    else:
+        model_info["link"] = href
+
+
+def _apply_c4_fields(model_info: Dict[str, Any], c4_encoded: str) -> None:
+    """根据 data-autolog 中的 c4 参数补齐 id / organization 字段（不覆盖已有值）"""
+    c4_value = urllib.parse.unquote(c4_encoded)
+    # c4 格式通常是 "Organization/ModelName"
+    if "/" in c4_value:
+        parts = c4_value.split("/")
+        if len(parts) >= 2:
+            if "organization" not in model_info:
+                model_info["organization"] = parts[0]
+            if "id" not in model_info:
+                model_info["id"] = c4_value
+
+
+def _apply_meta_value(model_info: Dict[str, Any], field: str, value: str) -> None:
+    """填充 time / downloads / stars 元信息字段（已存在的字段不覆盖）"""
+    if field in model_info:
+        return
+    value = value.strip()
+    if not value:
+        return
+    if field == "time":
+        model_info["time"] = value
+    else:
+        count = _parse_count(value)
+        if count is not None:
+            model_info[field] = count
+
+
+def _fallback_chinese_name(all_text: str) -> Optional[str]:
+    """
+    没有标题标签时，从纯文本开头提取第一个中文短语作为名称
+
+    参数:
+        all_text: 去除 HTML 标签并规范化空白后的卡片文本
+
+    返回:
+        提取到的中文名称，找不到时返回 None
+    """
+    # 一次 finditer 同时拿到短语和位置，避免 findall 后再逐个 find 的二次扫描
+    for m in _RE_CJK.finditer(all_text):
+        # 名称只会出现在文本的开头部分（前200个字符）
+        if m.start() >= 200:
+            break
+        chinese_text = m.group()
+        # 排除任务类型关键词
+        if len(chinese_text) >= 2 and chinese_text not in _TASK_KWS:
+            return chinese_text
+
+    return None
+
+
+def _is_boundary_char(ch: str) -> bool:
+    """判断字符是否可以作为任务关键词的边界（空白、中文标点或汉字）"""
+    return ch.isspace() or ch in _CJK_PUNCT or '\u4e00' <= ch <= '\u9fff'
+
+
+def _detect_task_type_hs(all_text: str) -> Optional[str]:
+    """
+    Hyperscan 路径：向量化扫描命中全部关键词，返回最长且边界合法的一个
+
+    Hyperscan 按字节扫描，命中回调给出的是 UTF-8 字节偏移，
+    需要换算回字符偏移后再做边界检查。
+
+    参数:
+        all_text: 去除 HTML 标签并规范化空白后的卡片文本
+
+    返回:
+        匹配到的最长、最具体的任务类型关键词，没有匹配时返回 None
+    """
+    data = all_text.encode('utf-8')
+    raw_hits = []
+    _TASK_HS.scan(data, match_event_handler=lambda kw_id, start, end, flags, ctx:
+                  raw_hits.append((kw_id, start)))
+
+    hits = []
+    for kw_id, byte_start in raw_hits:
+        keyword = _TASK_KEYWORDS[kw_id]
+        # 字节偏移换算为字符偏移；偏移落在多字节序列中间时防御性忽略该命中
+        try:
+            start = len(data[:byte_start].decode('utf-8'))
+        except UnicodeDecodeError:
+            continue
+        hits.append((-len(keyword), start, keyword))
+
+    # 按（长度降序，位置升序）检查边界，第一个合法命中即为最长、最具体的
+    hits.sort()
+    text_len = len(all_text)
+    for neg_len, start, keyword in hits:
+        end = start - neg_len
+        if ((start == 0 or _is_boundary_char(all_text[start - 1]))
+                and (end >= text_len or _is_boundary_char(all_text[end]))):
+            return keyword
+
+    return None
+
+
+def _detect_task_type_ac(all_text: str) -> Optional[str]:
+    """
+    Aho–Corasick 路径：一次线性扫描命中全部关键词，返回最长且边界合法的一个
+
+    参数:
+        all_text: 去除 HTML 标签并规范化空白后的卡片文本
+
+    返回:
+        匹配到的最长、最具体的任务类型关键词，没有匹配时返回 None
+    """
+    hits = []
+    for end_index, keyword in _TASK_AC.iter(all_text):
+        start = end_index - len(keyword) + 1
+        hits.append((-len(keyword), start, keyword))
+
+    # 按（长度降序，位置升序）检查边界，第一个合法命中即为最长、最具体的
+    hits.sort()
+    text_len = len(all_text)
+    for neg_len, start, keyword in hits:
+        end = start - neg_len
+        if ((start == 0 or _is_boundary_char(all_text[start - 1]))
+                and (end >= text_len or _is_boundary_char(all_text[end]))):
+            return keyword
+
+    return None
+
+
+def _detect_task_type(all_text: str) -> Optional[str]:
+    """
+    从卡片文本中识别任务类型关键词
+
+    参数:
+        all_text: 去除 HTML 标签并规范化空白后的卡片文本
+
+    返回:
+        匹配到的最长、最具体的任务类型关键词，没有匹配时返回 None
+    """
+    if _TASK_HS is not None:
+        try:
+            return _detect_task_type_hs(all_text)
+        except Exception as e:
+            logger.debug(f"Hyperscan 任务匹配失败，回退: {str(e)}")
+    if _TASK_AC is not None:
+        return _detect_task_type_ac(all_text)
+
+    # 回退路径：交替模式按长度降序只保证同一起始位置取最长，
+    # 与其他两条路径的"(长度降序, 位置升序)"选择一致还需扫完全文取最长命中
+    best = None
+    for match in _RE_TASKS.finditer(all_text):
+        keyword = match.group(0)
+        if best is None or len(keyword) > len(best):
+            best = keyword
+    return best
 
 
 def extract_model_info_from_link(link_html: str) -> Dict[str, Any]:
     """
     从 <a data-autolog...> 标签的 outerHTML 中提取模型信息
-    
+
+    优先使用 selectolax（Lexbor C 解析器）建树后按 CSS 选择器提取，
+    未安装或解析失败时回退到原有的正则提取路径。
+    解析结果按内容哈希缓存并跨运行持久化，重复出现的卡片直接命中缓存。
+
     参数:
         link_html: <a> 标签的完整 HTML 内容
-        
+
+    返回:
+        Dict: 包含模型信息的字典
+    """
+    cache_key = _card_hash(link_html)
+    cached = _PARSE_CACHE.get(cache_key)
+    if cached is not None:
+        # 命中的键挪到插入序末尾，避免被 save_parse_cache 当最旧条目淘汰
+        _PARSE_CACHE[cache_key] = _PARSE_CACHE.pop(cache_key)
+        # 返回副本，调用方会就地补齐 id/name 等字段
+        return cached.copy()
+
+    model_info = None
+    if LexborHTMLParser is not None:
+        try:
+            model_info = _extract_model_info_selectolax(link_html)
+        except Exception as e:
+            logger.debug(f"selectolax 提取失败，回退到正则提取: {str(e)}")
+    if model_info is None:
+        model_info = _extract_model_info_regex(link_html)
+
+    _PARSE_CACHE[cache_key] = model_info
+    return model_info.copy()
+
+
+def _extract_model_info_selectolax(link_html: str) -> Dict[str, Any]:
+    """
+    selectolax 提取路径：对单块卡片 HTML 建树后提取各字段
+
+    参数:
+        link_html: <a> 标签的完整 HTML 内容
+
+    返回:
+        Dict: 包含模型信息的字典
+    """
+    tree = LexborHTMLParser(link_html)
+    link_node = tree.css_first('a[href]') or tree.css_first('a')
+    if link_node is None:
+        raise ValueError("卡片 HTML 中未找到 <a> 标签")
+    return _extract_model_info_from_node(link_node)
+
+
+def _extract_model_info_from_node(link_node) -> Dict[str, Any]:
+    """
+    从 selectolax 的模型卡片 <a> 节点中提取模型信息
+
+    整页解析路径直接传入文档树上的节点，无需把节点重新序列化成 HTML 再建树。
+
+    参数:
+        link_node: 模型卡片对应的 <a> 节点
+
     返回:
         Dict: 包含模型信息的字典
     """
     model_info = {}
-    
+    attrs = link_node.attributes
+    _apply_href_fields(model_info, (attrs.get('href') or '').strip())
+
+    # 从 data-autolog 属性中提取 c4（模型 ID）
+    c4_match = _RE_C4.search(attrs.get('data-autolog') or '')
+    if c4_match:
+        _apply_c4_fields(model_info, c4_match.group(1))
+
+    # 优先提取中文名称作为 name：先找 ms-title-font，再退到 class 含 title 的 span/div
+    title_node = (link_node.css_first('span.ms-title-font')
+                  or link_node.css_first('span[class*="title"]')
+                  or link_node.css_first('div[class*="title"]'))
+    all_text = None
+    if title_node is not None:
+        title_text = title_node.text(deep=True).strip()
+        if title_text:
+            model_info["name"] = title_text
+
+    if "name" not in model_info:
+        # 如果没找到标题标签，尝试从文本中提取第一个中文短语
+        all_text = ' '.join(link_node.text(deep=True, separator=' ').split())
+        chinese_name = _fallback_chinese_name(all_text)
+        if chinese_name:
+            model_info["name"] = chinese_name
+        elif "id" in model_info:
+            # 如果都没有找到，使用模型 ID 的最后一部分作为后备
+            parts = model_info["id"].split("/")
+            if len(parts) >= 2:
+                model_info["name"] = parts[-1]
+
+    # 查找描述信息
+    desc_node = link_node.css_first('div[class*="desc"]')
+    if desc_node is not None:
+        desc_text = desc_node.text(deep=True).strip()
+        if desc_text:
+            model_info["description"] = desc_text
+
+    # 提取时间、下载量和点赞数：按 <use> 图标 id 定位，取图标所在 div 的文本作为字段值
+    for use_node in link_node.css('use'):
+        icon = (use_node.attributes.get('xlink:href')
+                or use_node.attributes.get('href') or '').lstrip('#').lower()
+        if not icon.startswith('icon-'):
+            continue
+        field = _META_ICON_FIELDS.get(icon[len('icon-'):])
+        if field is None:
+            continue
+        div_node = use_node.parent
+        while div_node is not None and div_node.tag != 'div':
+            div_node = div_node.parent
+        if div_node is not None:
+            _apply_meta_value(model_info, field, div_node.text(deep=True))
+
+    # 提取模型模态描述标签（任务类型）
+    if all_text is None:
+        all_text = ' '.join(link_node.text(deep=True, separator=' ').split())
+    task_type = _detect_task_type(all_text)
+    if task_type:
+        model_info["task_types"] = task_type
+
+    return model_info
+
+
+def _extract_model_info_regex(link_html: str) -> Dict[str, Any]:
+    """
+    正则提取路径：用预编译的正则从卡片 HTML 中逐字段提取模型信息
+
+    参数:
+        link_html: <a> 标签的完整 HTML 内容
+
+    返回:
+        Dict: 包含模型信息的字典
+    """
+    model_info = {}
+    # 去标签后的纯文本只在首次需要时计算一次，名称回退与任务类型识别共用
+    all_text = None
+
     try:
         # 提取 href 属性
-        href_match = re.search(r'href=["\']([^"\']+)["\']', link_html)
+        href_match = _RE_HREF.search(link_html)
         if href_match:
-            href = href_match.group(1).strip()
-            # 如果是相对路径，转换为完整 URL
-            if href.startswith("/models/"):
-                model_info["link"] = f"https://modelscope.cn{href}"
-                model_path = href.replace("/models/", "")
-                model_info["id"] = model_path
-                # 提取组织名称
-                parts = model_path.split("/")
-                if len(parts) >= 2:
-                    model_info["organization"] = parts[0]
-            else:
-                model_info["link"] = href
-        
+            _apply_href_fields(model_info, href_match.group(1).strip())
+
         # 从 data-autolog 属性中提取 c4（模型 ID）
-        c4_match = re.search(r'c4=([^&]+)', link_html)
+        c4_match = _RE_C4.search(link_html)
         if c4_match:
-            c4_encoded = c4_match.group(1)
-            c4_value = urllib.parse.unquote(c4_encoded)
-            # c4 格式通常是 "Organization/ModelName"
-            if "/" in c4_value:
-                parts = c4_value.split("/")
-                if len(parts) >= 2:
-                    if "organization" not in model_info:
-                        model_info["organization"] = parts[0]
-                    if "id" not in model_info:
-                        model_info["id"] = c4_value
+            _apply_c4_fields(model_info, c4_match.group(1))
         
         # 优先提取中文名称作为 name
         # 查找包含 ms-title-font 类的 span 标签（通常是模型的中文名称）
-        title_match = re.search(r'<span[^>]*class="[^"]*ms-title-font[^"]*"[^>]*>(.*?)</span>', link_html, re.DOTALL | re.IGNORECASE)
+        title_match = _RE_TITLE_MS.search(link_html)
         if not title_match:
             # 尝试查找其他可能的标题标签
-            title_match = re.search(r'<span[^>]*class="[^"]*title[^"]*"[^>]*>(.*?)</span>', link_html, re.DOTALL | re.IGNORECASE)
+            title_match = _RE_TITLE_SPAN.search(link_html)
         if not title_match:
-            title_match = re.search(r'<div[^>]*class="[^"]*title[^"]*"[^>]*>(.*?)</div>', link_html, re.DOTALL | re.IGNORECASE)
+            title_match = _RE_TITLE_DIV.search(link_html)
         
         if title_match:
-            title_text = re.sub(r'<[^>]+>', '', title_match.group(1)).strip()
+            title_text = _RE_TAG_STRIP.sub('', title_match.group(1)).strip()
             if title_text:
                 model_info["name"] = title_text
-        else:
-            # 如果没找到标题标签，尝试从文本中提取第一个中文短语
-            all_text = re.sub(r'<[^>]+>', ' ', link_html)
-            all_text = ' '.join(all_text.split())
-            
-            # 查找中文名称（通常是链接文本开头的第一个中文短语）
-            chinese_pattern = r'[\u4e00-\u9fff]+'
-            chinese_matches = re.findall(chinese_pattern, all_text)
-            
-            # 排除任务类型关键词
-            task_keywords = [
-                '文本生成图片', '文本生成视频', '视觉多模态理解', '统一多模态',
-                '文本生成', '图像描述', '语音合成', '图像分类', '目标检测',
-                '文本到图像', '图像到文本', '视频生成', '音频生成', '多模态理解'
-            ]
-            
-            # 查找第一个不是任务类型关键词的中文短语作为名称
-            chinese_name = None
-            for chinese_text in chinese_matches:
-                # 排除任务类型关键词
-                if chinese_text not in task_keywords and len(chinese_text) >= 2:
-                    # 检查是否在文本的开头部分（前200个字符）
-                    text_pos = all_text.find(chinese_text)
-                    if text_pos >= 0 and text_pos < 200:
-                        chinese_name = chinese_text
-                        break
-            
+
+        if "name" not in model_info:
+            # 如果没找到标题标签（或标题为空），尝试从文本中提取第一个中文短语
+            all_text = ' '.join(_RE_TAG_STRIP.sub(' ', link_html).split())
+
+            chinese_name = _fallback_chinese_name(all_text)
             if chinese_name:
                 model_info["name"] = chinese_name
-            else:
+            elif "id" in model_info:
                 # 如果都没有找到，使用模型 ID 的最后一部分作为后备
-                if "id" in model_info:
-                    parts = model_info["id"].split("/")
-                    if len(parts) >= 2:
-                        model_info["name"] = parts[-1]
+                parts = model_info["id"].split("/")
+                if len(parts) >= 2:
+                    model_info["name"] = parts[-1]
         
         # 查找描述信息
-        desc_match = re.search(r'<div[^>]*class="[^"]*desc[^"]*"[^>]*>(.*?)</div>', link_html, re.DOTALL | re.IGNORECASE)
+        desc_match = _RE_DESC.search(link_html)
         if desc_match:
-            desc_text = re.sub(r'<[^>]+>', '', desc_match.group(1)).strip()
+            desc_text = _RE_TAG_STRIP.sub('', desc_match.group(1)).strip()
             if desc_text:
                 model_info["description"] = desc_text
         
         # 提取时间、下载量和点赞数
         # 根据提供的 HTML 结构，这些信息在特定的 SVG 图标后面的 div 中
-        
-        # 1. 提取时间（在包含 icon-maasshijian-time-line1 的 SVG 后面的 div 中）
-        # 格式：<use xlink:href="#icon-maasshijian-time-line1"></use></svg></span>2025.03.07</div>
-        time_match = re.search(
-            r'xlink:href="#icon-maasshijian-time-line1"[^>]*>.*?</use></svg></span>([^<]+)</div>',
-            link_html,
-            re.DOTALL | re.IGNORECASE
-        )
-        if not time_match:
-            # 尝试更宽松的匹配
-            time_match = re.search(
-                r'#icon-maasshijian-time-line1"[^>]*>.*?</use>.*?</svg>.*?</span>([^<]+)</div>',
-                link_html,
-                re.DOTALL | re.IGNORECASE
-            )
-        
-        if time_match:
-            time_text = time_match.group(1).strip()
-            if time_text:
-                model_info["time"] = time_text
-        
-        # 2. 提取下载量（在包含 icon-maasa-zhuangtai216x16 的 SVG 后面的 div 中）
-        # 格式：<use xlink:href="#icon-maasa-zhuangtai216x16"></use></svg></span>19.3k</div>
-        downloads_match = re.search(
-            r'xlink:href="#icon-maasa-zhuangtai216x16"[^>]*>.*?</use></svg></span>([^<]+)</div>',
-            link_html,
-            re.DOTALL | re.IGNORECASE
-        )
-        if not downloads_match:
-            downloads_match = re.search(
-                r'#icon-maasa-zhuangtai216x16"[^>]*>.*?</use>.*?</svg>.*?</span>([^<]+)</div>',
-                link_html,
-                re.DOTALL | re.IGNORECASE
-            )
-        
-        if downloads_match:
-            downloads_text = downloads_match.group(1).strip()
-            if downloads_text:
-                try:
-                    downloads_str = downloads_text.upper()
-                    # 处理 K, M, B 等单位（不区分大小写）
-                    if 'K' in downloads_str:
-                        downloads = int(float(downloads_str.replace('K', '').replace('k', '')) * 1000)
-                    elif 'M' in downloads_str:
-                        downloads = int(float(downloads_str.replace('M', '').replace('m', '')) * 1000000)
-                    elif 'B' in downloads_str:
-                        downloads = int(float(downloads_str.replace('B', '').replace('b', '')) * 1000000000)
-                    else:
-                        downloads = int(float(downloads_str))
-                    model_info["downloads"] = downloads
-                except (ValueError, AttributeError):
-                    pass
-        
-        # 3. 提取点赞数/收藏数（在包含 icon-maasa-shoucangzhuangtai216x16 的 SVG 后面的 div 中）
-        # 格式：<use xlink:href="#icon-maasa-shoucangzhuangtai216x16"></use></svg></span>5</div>
-        stars_match = re.search(
-            r'xlink:href="#icon-maasa-shoucangzhuangtai216x16"[^>]*>.*?</use></svg></span>([^<]+)</div>',
-            link_html,
-            re.DOTALL | re.IGNORECASE
-        )
-        if not stars_match:
-            stars_match = re.search(
-                r'#icon-maasa-shoucangzhuangtai216x16"[^>]*>.*?</use>.*?</svg>.*?</span>([^<]+)</div>',
-                link_html,
-                re.DOTALL | re.IGNORECASE
-            )
-        
-        if stars_match:
-            stars_text = stars_match.group(1).strip()
-            if stars_text:
-                try:
-                    stars_str = stars_text.upper()
-                    # 处理 K, M, B 等单位
-                    if 'K' in stars_str:
-                        stars = int(float(stars_str.replace('K', '').replace('k', '')) * 1000)
-                    elif 'M' in stars_str:
-                        stars = int(float(stars_str.replace('M', '').replace('m', '')) * 1000000)
-                    elif 'B' in stars_str:
-                        stars = int(float(stars_str.replace('B', '').replace('b', '')) * 1000000000)
-                    else:
-                        stars = int(float(stars_str))
-                    model_info["stars"] = stars
-                except (ValueError, AttributeError):
-                    pass
-        
+        # 格式：<use xlink:href="#icon-..."></use></svg></span>19.3k</div>
+        # 用一次 finditer 按图标 id 分派三个字段，替代每个字段的两遍全文扫描
+        for meta_match in _RE_META.finditer(link_html):
+            field = _META_ICON_FIELDS[meta_match.group('kind')]
+            _apply_meta_value(model_info, field, meta_match.group('val'))
+
         # 提取模型模态描述标签（任务类型）
-        # 常见的任务类型关键词（按长度从长到短排序，优先匹配更具体的）
-        # 同时支持"文字"和"文本"两种写法
-        # 所有关键词都使用完全匹配，避免短关键词匹配到长关键词的一部分
-        task_keywords = [
-            '文字生成图片', '文本生成图片', '文字生成视频', '文本生成视频', 
-            '视觉多模态理解', '统一多模态', '文本到图像', '图像到文本',
-            '文字生成', '文本生成', '图像描述', '语音合成', 
-            '图像分类', '目标检测', '视频生成', '音频生成', '多模态理解'
-        ]
-        
-        task_type = None  # 只保留一个任务类型（最长的、最具体的）
-        # 先提取所有文本内容，去除 HTML 标签
-        all_text = re.sub(r'<[^>]+>', ' ', link_html)  # 用空格替换 HTML 标签
-        all_text = ' '.join(all_text.split())  # 规范化空白字符
-        
-        # 使用完全匹配，按长度从长到短匹配（避免短关键词匹配到长关键词的一部分）
-        # 由于关键词已按长度从长到短排序，第一个匹配到的就是最长的、最具体的
-        matched_positions = set()  # 记录已匹配的位置，避免重叠
-        
-        for keyword in task_keywords:
-            # 先查找当前关键词的所有可能匹配位置
-            pattern = re.escape(keyword)
-            all_matches = list(re.finditer(pattern, all_text, re.IGNORECASE))
-            
-            if not all_matches:
-                continue
-            
-            # 检查是否有匹配位置在已匹配的长关键词范围内
-            valid_match = None
-            for match in all_matches:
-                start, end = match.span()
-                
-                # 检查是否与已匹配的位置重叠（在已匹配范围内）
-                is_in_matched_range = False
-                for matched_start, matched_end in matched_positions:
-                    # 如果当前匹配位置在已匹配范围内，说明是长关键词的一部分
-                    if start >= matched_start and end <= matched_end:
-                        is_in_matched_range = True
-                        break
-                
-                if not is_in_matched_range:
-                    # 找到了一个不在已匹配范围内的位置，检查是否是完全匹配
-                    before_char = all_text[start-1] if start > 0 else ' '
-                    after_char = all_text[end] if end < len(all_text) else ' '
-                    
-                    is_before_valid = (start == 0 or 
-                                     before_char.isspace() or 
-                                     before_char in '，。、；：！？' or
-                                     '\u4e00' <= before_char <= '\u9fff')
-                    
-                    is_after_valid = (end >= len(all_text) or 
-                                     after_char.isspace() or 
-                                     after_char in '，。、；：！？' or
-                                     '\u4e00' <= after_char <= '\u9fff')
-                    
-                    if is_before_valid and is_after_valid:
-                        # 检查是否与已匹配位置重叠
-                        overlaps = False
-                        for matched_start, matched_end in matched_positions:
-                            if not (end <= matched_start or start >= matched_end):
-                                overlaps = True
-                                break
-                        
-                        # 额外检查：如果短关键词紧邻长关键词，且是长关键词的一部分，应该跳过
-                        # 例如："文本生成图片文本生成"中，不应该匹配"文本生成"
-                        # 但如果有分隔符（空格、标点等），应该允许匹配
-                        is_adjacent_to_longer = False
-                        for matched_start, matched_end in matched_positions:
-                            matched_text = all_text[matched_start:matched_end]
-                            # 如果当前关键词是已匹配文本的一部分
-                            if keyword in matched_text:
-                                # 检查是否紧邻且没有分隔符
-                                # 如果紧邻（相差0-1个字符），检查中间是否有分隔符
-                                gap_start = min(matched_end, start)
-                                gap_end = max(matched_end, start)
-                                if gap_end - gap_start <= 1:
-                                    # 检查中间字符是否是分隔符
-                                    if gap_start < len(all_text):
-                                        gap_char = all_text[gap_start:gap_end]
-                                        # 如果有空格或标点，认为是分隔的，允许匹配
-                                        if gap_char and (gap_char.isspace() or gap_char in '，。、；：！？'):
-                                            continue  # 有分隔符，允许匹配
-                                    # 没有分隔符，且是长关键词的一部分，跳过
-                                    is_adjacent_to_longer = True
-                                    break
-                                
-                                # 检查另一个方向
-                                gap_start = min(matched_start, end)
-                                gap_end = max(matched_start, end)
-                                if gap_end - gap_start <= 1:
-                                    if gap_start < len(all_text):
-                                        gap_char = all_text[gap_start:gap_end]
-                                        if gap_char and (gap_char.isspace() or gap_char in '，。、；：！？'):
-                                            continue
-                                    is_adjacent_to_longer = True
-                                    break
-                        
-                        if not overlaps and not is_adjacent_to_longer:
-                            valid_match = (start, end)
-                            break
-            
-            if not valid_match:
-                continue  # 没有找到有效的匹配位置
-            
-            # 使用找到的有效匹配位置（第一个匹配到的就是最长的、最具体的）
-            start, end = valid_match
-            matched_positions.add((start, end))
-            task_type = keyword  # 只保留第一个匹配到的任务类型
-            break  # 找到第一个匹配就退出，因为已经是最长的了
-        
+        if all_text is None:
+            all_text = ' '.join(_RE_TAG_STRIP.sub(' ', link_html).split())
+        task_type = _detect_task_type(all_text)
         # 如果找到了任务标签，保存到模型信息中（单个字符串，不是数组）
         if task_type:
             model_info["task_types"] = task_type
@@ -327,6 +709,21 @@ def extract_model_info_from_link(link_html: str) -> Dict[str, Any]:
     return model_info
 
 
+def _extract_model_blocks(model_blocks: List[str]) -> List[Dict[str, Any]]:
+    """逐块提取模型信息（分隔符路径与正则回退路径使用）"""
+    extracted = []
+    for i, block_html in enumerate(model_blocks, 1):
+        try:
+            # 清理块内容（去除分隔符周围的空白）
+            block_html = block_html.strip()
+            if not block_html:
+                continue
+            extracted.append(extract_model_info_from_link(block_html))
+        except Exception as e:
+            logger.warning(f"解析模型块 {i} 时出错: {str(e)}")
+    return extracted
+
+
 def parse_html_file(html_file: str) -> List[Dict[str, Any]]:
     """
     从 HTML 文件中解析模型列表
@@ -339,55 +736,65 @@ def parse_html_file(html_file: str) -> List[Dict[str, Any]]:
     """
     models = []
     seen_models = set()
-    
+
     try:
+        # mmap 以字节形式映射文件，不复制进 Python 字符串；
+        # selectolax 直接消费字节，只有真正需要文本的路径才按需解码
         logger.info(f"正在读取 HTML 文件: {html_file}")
-        with open(html_file, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        
-        logger.info(f"HTML 文件大小: {len(html_content)} 字符")
-        
-        # 检查是否是模型块分隔格式（包含分隔符）
-        if "<!-- ===== MODEL BLOCK SEPARATOR ===== -->" in html_content:
-            # 按分隔符分割模型块
-            model_blocks = html_content.split("<!-- ===== MODEL BLOCK SEPARATOR ===== -->")
-            logger.info(f"检测到模型块分隔格式，找到 {len(model_blocks)} 个模型块")
-        else:
-            # 查找所有包含 data-autolog 和 c3=modelCard 的 <a> 标签
-            link_pattern = r'<a[^>]*data-autolog[^>]*c3=modelCard[^>]*>.*?</a>'
-            model_blocks = re.findall(link_pattern, html_content, re.DOTALL | re.IGNORECASE)
-            logger.info(f"从 HTML 中查找模型链接，找到 {len(model_blocks)} 个模型块")
-        
-        for i, block_html in enumerate(model_blocks, 1):
+        with open(html_file, "rb") as f:
             try:
-                # 清理块内容（去除分隔符周围的空白）
-                block_html = block_html.strip()
-                if not block_html:
-                    continue
-                
-                model_info = extract_model_info_from_link(block_html)
-                
-                # 确保至少有一个标识符
-                if not model_info.get("id") and not model_info.get("name"):
-                    continue
-                
-                # 确保有基本字段
-                if not model_info.get("id"):
-                    model_info["id"] = model_info.get("name", "")
-                if not model_info.get("name"):
-                    model_info["name"] = model_info.get("id", "")
-                
-                # 使用 id 作为唯一标识
-                model_key = model_info.get("id", "").lower().strip()
-                if not model_key or model_key in seen_models:
-                    continue
-                seen_models.add(model_key)
-                
-                models.append(model_info)
-                
-            except Exception as e:
-                logger.warning(f"解析模型块 {i} 时出错: {str(e)}")
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                logger.warning(f"HTML 文件为空: {html_file}")
+                return []
+
+            with mm:
+                logger.info(f"HTML 文件大小: {len(mm)} 字节")
+
+                # 检查是否是模型块分隔格式（包含分隔符）
+                if mm.find(_SEPARATOR_BYTES) != -1:
+                    # 按分隔符分割模型块，逐块解码而不是先解码整个文件
+                    model_blocks = [block.decode("utf-8", errors="replace")
+                                    for block in mm[:].split(_SEPARATOR_BYTES)]
+                    logger.info(f"检测到模型块分隔格式，找到 {len(model_blocks)} 个模型块")
+                    extracted = _extract_model_blocks(model_blocks)
+                elif LexborHTMLParser is not None:
+                    # 整个文档只建一次 DOM 树并直接遍历卡片节点；
+                    # 字节直接交给 Lexbor，跳过 Python 层的 UTF-8 解码
+                    tree = LexborHTMLParser(mm[:])
+                    card_nodes = tree.css('a[data-autolog*="c3=modelCard"]')
+                    logger.info(f"从 DOM 中查找模型链接，找到 {len(card_nodes)} 个模型卡片")
+                    extracted = []
+                    for i, card_node in enumerate(card_nodes, 1):
+                        try:
+                            extracted.append(_extract_model_info_from_node(card_node))
+                        except Exception as e:
+                            logger.warning(f"解析模型卡片 {i} 时出错: {str(e)}")
+                else:
+                    # 查找所有包含 data-autolog 和 c3=modelCard 的 <a> 标签
+                    html_content = mm[:].decode("utf-8", errors="replace")
+                    model_blocks = _RE_MODEL_CARD.findall(html_content)
+                    logger.info(f"从 HTML 中查找模型链接，找到 {len(model_blocks)} 个模型块")
+                    extracted = _extract_model_blocks(model_blocks)
+
+        for model_info in extracted:
+            # 确保至少有一个标识符
+            if not model_info.get("id") and not model_info.get("name"):
                 continue
+
+            # 确保有基本字段
+            if not model_info.get("id"):
+                model_info["id"] = model_info.get("name", "")
+            if not model_info.get("name"):
+                model_info["name"] = model_info.get("id", "")
+
+            # 使用 id 作为唯一标识
+            model_key = model_info.get("id", "").lower().strip()
+            if not model_key or model_key in seen_models:
+                continue
+            seen_models.add(model_key)
+
+            models.append(model_info)
         
         logger.info(f"成功解析 {len(models)} 个模型")
         
@@ -395,235 +802,317 @@ def parse_html_file(html_file: str) -> List[Dict[str, Any]]:
         logger.error(f"HTML 文件不存在: {html_file}")
         return []
     except Exception as e:
-        logger.error(f"解析 HTML 文件时出错: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"解析 HTML 文件时出错: {str(e)}")
         return []
     
     return models
 
 
+def _ensure_basic_fields(model_info: Dict[str, Any]) -> bool:
+    """补齐 id / name 互为后备；两者都缺失时返回 False"""
+    if not model_info.get("id") and not model_info.get("name"):
+        return False
+    if not model_info.get("id"):
+        model_info["id"] = model_info.get("name", "")
+    if not model_info.get("name"):
+        model_info["name"] = model_info.get("id", "")
+    return True
+
+
+def _model_info_from_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    由页面内提取的结构化字段构建模型信息
+
+    参数:
+        fields: _EXTRACT_CARDS_JS 返回的单张卡片的字段字典
+
+    返回:
+        Dict: 包含模型信息的字典
+    """
+    model_info = {}
+    all_text = None
+
+    _apply_href_fields(model_info, (fields.get("href") or "").strip())
+
+    # 从 data-autolog 属性中提取 c4（模型 ID）
+    c4_match = _RE_C4.search(fields.get("autolog") or "")
+    if c4_match:
+        _apply_c4_fields(model_info, c4_match.group(1))
+
+    title = (fields.get("title") or "").strip()
+    if title:
+        model_info["name"] = title
+    else:
+        # 如果没找到标题标签，尝试从文本中提取第一个中文短语
+        all_text = ' '.join((fields.get("text") or "").split())
+        chinese_name = _fallback_chinese_name(all_text)
+        if chinese_name:
+            model_info["name"] = chinese_name
+        elif "id" in model_info:
+            # 如果都没有找到，使用模型 ID 的最后一部分作为后备
+            parts = model_info["id"].split("/")
+            if len(parts) >= 2:
+                model_info["name"] = parts[-1]
+
+    desc = (fields.get("desc") or "").strip()
+    if desc:
+        model_info["description"] = desc
+
+    # 时间、下载量和点赞数已由页面内脚本按图标 id 提取
+    for field in ("time", "downloads", "stars"):
+        value = fields.get(field)
+        if value:
+            _apply_meta_value(model_info, field, value)
+
+    # 提取模型模态描述标签（任务类型）
+    if all_text is None:
+        all_text = ' '.join((fields.get("text") or "").split())
+    task_type = _detect_task_type(all_text)
+    if task_type:
+        model_info["task_types"] = task_type
+
+    return model_info
+
+
+def _parse_page_fields(page_num: int, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    解析一页的结构化卡片字段列表（模块级函数，可被进程池 pickle）
+
+    参数:
+        page_num: 页码（仅用于日志）
+        rows: _EXTRACT_CARDS_JS 返回的字段字典列表
+
+    返回:
+        (当前页提取出的模型信息列表, 空的缓存增量)
+        结构化字段不经过 HTML 解析缓存，增量恒为空，仅为与
+        _parse_page_blocks 保持一致的返回形状
+    """
+    page_models = []
+    for i, fields in enumerate(rows, 1):
+        try:
+            model_info = _model_info_from_fields(fields)
+            if not _ensure_basic_fields(model_info):
+                logger.debug(f"第 {page_num} 页模型卡片 {i} 缺少标识符，跳过")
+                continue
+            page_models.append(model_info)
+        except Exception as e:
+            logger.warning(f"处理第 {page_num} 页模型卡片 {i} 时出错: {str(e)}")
+            continue
+
+    return page_models, {}
+
+
+def _parse_page_blocks(page_num: int, model_blocks: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    解析一页的模型卡片 outerHTML 列表（模块级函数，可被进程池 pickle）
+
+    参数:
+        page_num: 页码（仅用于日志）
+        model_blocks: 模型卡片的 outerHTML 列表
+
+    返回:
+        (当前页提取出的模型信息列表, 本次调用新增的缓存条目)
+        解析运行在工作进程中，其 _PARSE_CACHE 与父进程不共享，
+        新条目必须随返回值带回父进程合并后才能持久化
+    """
+    page_models = []
+    known_keys = set(_PARSE_CACHE)
+    for i, block_html in enumerate(model_blocks, 1):
+        try:
+            # 从 outerHTML 中提取模型信息
+            model_info = extract_model_info_from_link(block_html)
+            if not _ensure_basic_fields(model_info):
+                logger.debug(f"第 {page_num} 页模型卡片 {i} 缺少标识符，跳过")
+                continue
+            page_models.append(model_info)
+        except Exception as e:
+            logger.warning(f"处理第 {page_num} 页模型卡片 {i} 时出错: {str(e)}")
+            continue
+
+    cache_delta = {key: value for key, value in _PARSE_CACHE.items() if key not in known_keys}
+    return page_models, cache_delta
+
+
+
+async def _switch_to_chinese(page) -> None:
+    """
+    点击语言切换按钮把页面切换到中文
+
+    优先用 Playwright 原生选择器引擎定位图标并点击（选择器在浏览器端
+    编译为原生匹配器），失败时回退到 JS 脚本逐层查找可点击元素。
+    """
+    logger.info("正在切换到中文...")
+    try:
+        await page.locator(
+            'svg:has(use[xlink\\:href="#icon-maaszhongyingzhuanhuan-CN-EN-line"])'
+        ).first.click(timeout=2000)
+        logger.info("已点击语言切换按钮，等待页面切换...")
+        await asyncio.sleep(2)  # 等待语言切换完成
+        return
+    except Exception as e:
+        logger.debug(f"原生选择器点击语言切换按钮失败: {str(e)}，回退到 JS 查找")
+
+    try:
+        clicked = await page.evaluate(_LANG_TOGGLE_JS)
+        if clicked:
+            logger.info("已点击语言切换按钮，等待页面切换...")
+            await asyncio.sleep(2)  # 等待语言切换完成
+        else:
+            logger.warning("未找到语言切换按钮，继续执行...")
+    except Exception as e:
+        logger.warning(f"切换语言时出错: {str(e)}，继续执行...")
+
+
+async def _fetch_page(browser_context, page_num: int, lang_ready: asyncio.Event) -> List[Dict[str, Any]]:
+    """
+    抓取并解析单个分页（每页使用独立的 page，可被并发调度）
+
+    第 1 页负责把站点切换到中文，完成后置位 lang_ready；其余页先等待该
+    事件再导航，保证拿到的是中文页面。
+
+    参数:
+        browser_context: 共享的浏览器上下文
+        page_num: 页码
+        lang_ready: 语言切换完成事件
+
+    返回:
+        List[Dict]: 当前页提取出的模型信息列表
+    """
+    page = None
+    try:
+        if page_num != 1:
+            await lang_ready.wait()
+
+        page = await browser_context.new_page()
+        page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+
+        # 构建当前页的 URL
+        current_url = f"{MODELSCOPE_BASE_URL}&page={page_num}"
+        logger.info(f"正在访问第 {page_num} 页: {current_url}")
+
+        try:
+            await page.goto(current_url, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT)
+            await asyncio.sleep(PAGE_LOAD_WAIT_TIME)  # 等待页面完全加载
+        except Exception as e:
+            logger.error(f"访问第 {page_num} 页失败: {str(e)}")
+            return []
+
+        # 只在第一页切换到中文
+        if page_num == 1:
+            await _switch_to_chinese(page)
+            lang_ready.set()
+
+        # 等待模型列表加载
+        try:
+            await page.wait_for_selector('a[data-autolog*="c3=modelCard"]', timeout=15000)
+            logger.debug(f"第 {page_num} 页找到模型卡片链接")
+        except Exception as e:
+            logger.warning(f"第 {page_num} 页未找到模型卡片: {str(e)}，继续执行...")
+
+        # 优先在页面内直接提取结构化字段：浏览器端 DOM 查询以原生速度运行，
+        # CDP 只传输小字段字典，Python 端不再需要解析卡片 HTML
+        logger.info(f"正在获取第 {page_num} 页所有模型卡片...")
+        loop = asyncio.get_running_loop()
+        rows = None
+        try:
+            rows = await page.evaluate(_EXTRACT_CARDS_JS)
+        except Exception as e:
+            logger.warning(f"第 {page_num} 页页面内结构化提取失败: {str(e)}，回退到 outerHTML 提取")
+
+        if rows:
+            logger.info(f"第 {page_num} 页找到 {len(rows)} 个模型卡片，提交后台解析...")
+            parse_future = loop.run_in_executor(_get_parse_pool(), _parse_page_fields, page_num, rows)
+        else:
+            # 回退路径：获取拼接后的 outerHTML（单个字符串过 CDP），Python 端切分解析
+            blocks_str = await page.evaluate(
+                "() => Array.from(document.querySelectorAll('a[data-autolog*=\"c3=modelCard\"]'))"
+                ".map(link => link.outerHTML)"
+                f".join('{MODEL_BLOCK_SEPARATOR}')"
+            )
+            model_blocks = blocks_str.split(MODEL_BLOCK_SEPARATOR) if blocks_str else []
+
+            if not model_blocks:
+                logger.warning(f"第 {page_num} 页未获取到任何模型卡片")
+                return []
+
+            logger.info(f"第 {page_num} 页找到 {len(model_blocks)} 个模型卡片，提交后台解析...")
+            parse_future = loop.run_in_executor(_get_parse_pool(), _parse_page_blocks, page_num, model_blocks)
+
+        # 解析在工作进程中进行，事件循环可同时调度其他页面的网络等待
+        page_models, cache_delta = await parse_future
+        if cache_delta:
+            # 把工作进程新增的缓存条目合并回父进程，main 结束时统一持久化
+            _PARSE_CACHE.update(cache_delta)
+        logger.info(f"第 {page_num} 页成功提取了 {len(page_models)} 个模型")
+        return page_models
+
+    except Exception as e:
+        logger.error(f"处理第 {page_num} 页时出错: {str(e)}")
+        return []
+    finally:
+        # 第 1 页无论成败都要置位事件，避免其余页面永久等待
+        if page_num == 1:
+            lang_ready.set()
+        # 只关闭本页面，共享的 playwright 实例由 shutdown_shared_browser 统一停止
+        if page:
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning(f"关闭页面时出错: {e}")
+
+
 async def fetch_modelscope_models() -> List[Dict[str, Any]]:
     """
-    从 ModelScope 页面获取模型信息（抓取第 1-5 页）
-    
+    从 ModelScope 页面获取模型信息（并发抓取第 1-5 页）
+
     返回:
         List[Dict]: 包含模型关键信息的列表
     """
-    all_models = []
-    playwright = None
-    
+    # 插入有序的 dict 按 id 去重：O(1) 判重，无需抓取结束后再整体遍历一遍
+    unique_models: Dict[str, Dict[str, Any]] = {}
+    keyless_models: List[Dict[str, Any]] = []
+    total_extracted = 0
+
     try:
-        # 连接到浏览器
-        playwright, browser_context, page = await connect_to_browser()
-        if not playwright or not browser_context or not page:
+        # 获取共享的浏览器上下文
+        browser_context = await get_shared_context()
+        if not browser_context:
             logger.error("无法连接到浏览器，退出")
             return []
-        
-        # 遍历第 1-5 页
-        for page_num in range(1, MODELSCOPE_PAGES + 1):
-            try:
-                # 构建当前页的 URL
-                current_url = f"{MODELSCOPE_BASE_URL}&page={page_num}"
-                logger.info(f"正在访问第 {page_num} 页: {current_url}")
-                
-                try:
-                    await page.goto(current_url, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT)
-                    await asyncio.sleep(PAGE_LOAD_WAIT_TIME)  # 等待页面完全加载
-                except Exception as e:
-                    logger.error(f"访问第 {page_num} 页失败: {str(e)}")
-                    continue
-                
-                # 只在第一页切换到中文
-                if page_num == 1:
-                    try:
-                        logger.info("正在切换到中文...")
-                        clicked = await page.evaluate("""
-                            () => {
-                                // 查找所有 use 元素，检查 xlink:href 属性（避免使用无效的 CSS 选择器）
-                                const allUses = document.querySelectorAll('use');
-                                let targetUse = null;
-                                
-                                for (let use of allUses) {
-                                    const href = use.getAttribute('xlink:href') || use.getAttribute('href');
-                                    if (href && href === '#icon-maaszhongyingzhuanhuan-CN-EN-line') {
-                                        targetUse = use;
-                                        break;
-                                    }
-                                }
-                                
-                                if (!targetUse) {
-                                    return false;
-                                }
-                                
-                                // 找到包含该 use 的 SVG 元素
-                                const svgElement = targetUse.closest('svg');
-                                if (!svgElement) {
-                                    return false;
-                                }
-                                
-                                // 查找 SVG 的父元素（可能是 button、a 或其他可点击元素）
-                                let clickable = svgElement.closest('button') || 
-                                                svgElement.closest('a') || 
-                                                svgElement.closest('[role="button"]') ||
-                                                svgElement.closest('div[onclick]') ||
-                                                svgElement.closest('[data-spm-anchor-id]')?.parentElement ||
-                                                svgElement.parentElement;
-                                
-                                if (clickable) {
-                                    // 尝试多种点击方式
-                                    try {
-                                        clickable.click();
-                                        return true;
-                                    } catch (e) {
-                                        // 如果 click() 失败，尝试 dispatchEvent
-                                        try {
-                                            const clickEvent = new MouseEvent('click', {
-                                                bubbles: true,
-                                                cancelable: true,
-                                                view: window
-                                            });
-                                            clickable.dispatchEvent(clickEvent);
-                                            return true;
-                                        } catch (e2) {
-                                            return false;
-                                        }
-                                    }
-                                }
-                                
-                                // 如果找不到父元素，尝试向上查找
-                                let element = svgElement;
-                                for (let i = 0; i < 5; i++) {
-                                    element = element.parentElement;
-                                    if (!element) break;
-                                    
-                                    // 检查是否是 button、a 或其他可点击元素
-                                    if (element.tagName === 'BUTTON' || 
-                                        element.tagName === 'A' || 
-                                        element.getAttribute('role') === 'button' ||
-                                        element.onclick ||
-                                        element.getAttribute('data-spm-anchor-id') ||
-                                        element.style.cursor === 'pointer') {
-                                        try {
-                                            element.click();
-                                            return true;
-                                        } catch (e) {
-                                            try {
-                                                const clickEvent = new MouseEvent('click', {
-                                                    bubbles: true,
-                                                    cancelable: true,
-                                                    view: window
-                                                });
-                                                element.dispatchEvent(clickEvent);
-                                                return true;
-                                            } catch (e2) {
-                                                continue;
-                                            }
-                                        }
-                                    }
-                                }
-                                
-                                return false;
-                            }
-                        """)
-                        
-                        if clicked:
-                            logger.info("已点击语言切换按钮，等待页面切换...")
-                            await asyncio.sleep(2)  # 等待语言切换完成
-                        else:
-                            logger.warning("未找到语言切换按钮，继续执行...")
-                    except Exception as e:
-                        logger.warning(f"切换语言时出错: {str(e)}，继续执行...")
-                
-                # 等待模型列表加载
-                try:
-                    await page.wait_for_selector('a[data-autolog*="c3=modelCard"]', timeout=15000)
-                    logger.debug(f"第 {page_num} 页找到模型卡片链接")
-                except Exception as e:
-                    logger.warning(f"第 {page_num} 页未找到模型卡片: {str(e)}，继续执行...")
-                
-                # 获取当前页所有模型卡片的 outerHTML
-                logger.info(f"正在获取第 {page_num} 页所有模型卡片的 outerHTML...")
-                model_blocks = await page.evaluate("""
-                    () => {
-                        const links = document.querySelectorAll('a[data-autolog*="c3=modelCard"]');
-                        const blocks = [];
-                        links.forEach(link => {
-                            blocks.push(link.outerHTML);
-                        });
-                        return blocks;
-                    }
-                """)
-                
-                if not model_blocks or len(model_blocks) == 0:
-                    logger.warning(f"第 {page_num} 页未获取到任何模型卡片")
-                    continue
-                
-                logger.info(f"第 {page_num} 页找到 {len(model_blocks)} 个模型卡片，开始提取信息...")
-                
-                # 从当前页的模型块中提取信息
-                page_models = []
-                for i, block_html in enumerate(model_blocks, 1):
-                    try:
-                        logger.debug(f"正在处理第 {page_num} 页第 {i}/{len(model_blocks)} 个模型卡片...")
-                        
-                        # 从 outerHTML 中提取模型信息
-                        model_info = extract_model_info_from_link(block_html)
-                        
-                        # 确保至少有一个标识符
-                        if not model_info.get("id") and not model_info.get("name"):
-                            logger.debug(f"第 {page_num} 页模型卡片 {i} 缺少标识符，跳过")
-                            continue
-                        
-                        # 确保有基本字段
-                        if not model_info.get("id"):
-                            model_info["id"] = model_info.get("name", "")
-                        if not model_info.get("name"):
-                            model_info["name"] = model_info.get("id", "")
-                        
-                        page_models.append(model_info)
-                        
-                    except Exception as e:
-                        logger.warning(f"处理第 {page_num} 页模型卡片 {i} 时出错: {str(e)}")
-                        continue
-                
-                logger.info(f"第 {page_num} 页成功提取了 {len(page_models)} 个模型")
-                all_models.extend(page_models)
-                
-            except Exception as e:
-                logger.error(f"处理第 {page_num} 页时出错: {str(e)}")
+
+        # 各分页相互独立，使用独立页面并发抓取，总耗时接近单页耗时
+        lang_ready = asyncio.Event()
+        page_results = await asyncio.gather(
+            *[_fetch_page(browser_context, page_num, lang_ready)
+              for page_num in range(1, MODELSCOPE_PAGES + 1)],
+            return_exceptions=True
+        )
+
+        for page_num, page_models in enumerate(page_results, 1):
+            if isinstance(page_models, BaseException):
+                logger.error(f"抓取第 {page_num} 页失败: {str(page_models)}")
                 continue
-        
-        # 去重：使用 id 作为唯一标识
-        seen_models = set()
-        unique_models = []
-        for model_info in all_models:
-            model_key = model_info.get("id", "").lower().strip()
-            if model_key and model_key not in seen_models:
-                seen_models.add(model_key)
-                unique_models.append(model_info)
-            elif not model_key:
-                # 如果没有 id，也添加（可能是异常情况）
-                unique_models.append(model_info)
-        
-        logger.info(f"总共从 {MODELSCOPE_PAGES} 页中提取了 {len(unique_models)} 个唯一模型（去重前: {len(all_models)} 个）")
-        
-        return unique_models
-        
+            total_extracted += len(page_models)
+
+            # 使用 id 作为唯一标识，首次出现的保留
+            for model_info in page_models:
+                model_key = model_info.get("id", "").lower().strip()
+                if not model_key:
+                    # 如果没有 id，也添加（可能是异常情况）
+                    keyless_models.append(model_info)
+                elif model_key not in unique_models:
+                    unique_models[model_key] = model_info
+
+        results = list(unique_models.values()) + keyless_models
+        logger.info(f"总共从 {MODELSCOPE_PAGES} 页中提取了 {len(results)} 个唯一模型（去重前: {total_extracted} 个）")
+
+        return results
+
     except Exception as e:
-        logger.error(f"获取模型信息过程中出错: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"获取模型信息过程中出错: {str(e)}")
         return []
     finally:
-        # 通过 CDP 连接时，只停止 playwright 实例，不关闭浏览器
-        if playwright:
-            try:
-                await playwright.stop()
-            except Exception as e:
-                logger.warning(f"停止 playwright 时出错: {e}")
-    
-    return []
+        _shutdown_parse_pool()
 
 
 async def main():
@@ -647,8 +1136,7 @@ async def main():
                         "models": models
                     }
                     
-                    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-                        json.dump(output_data, f, ensure_ascii=False, indent=2)
+                    write_json_file(OUTPUT_FILE, output_data)
                     logger.success(f"成功保存 {len(models)} 个模型信息到 {OUTPUT_FILE}")
                 except Exception as e:
                     logger.error(f"保存文件失败: {str(e)}")
@@ -659,8 +1147,13 @@ async def main():
                 logger.info(f"  总模型数: {len(models)}")
                 logger.info(f"  模型列表页: {output_data['models_page']}")
                 logger.info(f"  API Key 管理页: {output_data['api_key_page']}")
-                models_with_org = sum(1 for m in models if m.get("organization"))
-                models_with_description = sum(1 for m in models if m.get("description"))
+                # 一次遍历同时统计两个计数
+                models_with_org = models_with_description = 0
+                for m in models:
+                    if m.get("organization"):
+                        models_with_org += 1
+                    if m.get("description"):
+                        models_with_description += 1
                 logger.info(f"  有组织的模型: {models_with_org}")
                 logger.info(f"  有描述的模型: {models_with_description}")
                 logger.info("=" * 60)
@@ -682,20 +1175,27 @@ async def main():
             else:
                 logger.warning("未获取到任何 ModelScope 模型信息")
         except Exception as e:
-            logger.error(f"获取 ModelScope 模型失败: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"获取 ModelScope 模型失败: {str(e)}")
             raise
         
     except KeyboardInterrupt:
         logger.warning("\n用户中断程序")
         raise
     except Exception as e:
-        logger.error(f"程序执行失败: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"程序执行失败: {str(e)}")
         raise
+    finally:
+        # 持久化解析缓存，供下次增量运行复用
+        save_parse_cache()
+
+
+async def _standalone():
+    """单独运行本模块时，结束后停止共享的 playwright 实例"""
+    try:
+        await main()
+    finally:
+        await shutdown_shared_browser()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_standalone())
@@ -3,13 +3,39 @@
 从 OpenRouter RSS 页面获取模型信息
 """
 import asyncio
-import json
+import functools
+import html
+import io
 import os
 import re
+import sys
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from loguru import logger
-from ..common import connect_to_browser, PAGE_LOAD_TIMEOUT, PAGE_LOAD_WAIT_TIME
+from ..common import get_shared_context, shutdown_shared_browser, write_json_file, PAGE_LOAD_TIMEOUT
+
+try:
+    # lxml 的 C 解析器流式解析 RSS，原生处理 CDATA 与实体，
+    # 比逐字段的多遍正则扫描快一个数量级；未安装时回退到正则解析
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# RSS 解析使用的正则（模块级编译一次，热路径直接复用编译好的 Pattern 对象）
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+# 正则回退路径：一个交替模式按标签名分派，一次 finditer 提取 item 的全部字段
+_FIELDS_RE = re.compile(r'<(title|description|link|guid|pubDate)[^>]*>(.*?)</\1>', re.DOTALL)
+_ITEM_FIELDS = ("title", "description", "link", "guid", "pubDate")
+# title 格式: "提供商: 模型名称 (模型ID)"，提供商前缀可选，
+# 一个带可选分组的模式同时覆盖两种格式，每个 title 最多一次正则调用
+_TITLE_RE = re.compile(r'^(?:(?P<prov>[^:]+):\s*)?(?P<name>.+?)\s*\((?P<mid>[^)]+)\)$')
+_TAG_RE = re.compile(r'<[^>]+>')
+# lxml 的 HTML 解析器实例（可复用；etree 未安装时为 None）
+_HTML_PARSER = etree.HTMLParser() if etree is not None else None
+# link 格式: https://openrouter.ai/provider/model-id
+_LINK_ID_RE = re.compile(r'openrouter\.ai/([^/]+/[^/]+)')
+# guid 格式可能是: "provider/model-id-date" 或 "provider/model-id"
+_GUID_ID_RE = re.compile(r'([^/]+/[^/-]+)')
 
 # 配置常量
 OPENROUTER_RSS_URL = "https://openrouter.ai/api/v1/models?use_rss=true"
@@ -18,9 +44,12 @@ OUTPUT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__f
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "openrouter.json")
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_cdata_content(text: str) -> str:
     """
     从 CDATA 中提取内容
+
+    RSS 条目经常重复刊出相同的标题和描述，lru_cache 让重复输入直接命中缓存。
     
     参数:
         text: 可能包含 CDATA 的文本
@@ -32,185 +61,326 @@ def extract_cdata_content(text: str) -> str:
         return ""
     
     # 提取 CDATA 内容
-    cdata_match = re.search(r'<!\[CDATA\[(.*?)\]\]>', text, re.DOTALL)
+    cdata_match = _CDATA_RE.search(text)
     if cdata_match:
         return cdata_match.group(1).strip()
     
     return text.strip()
 
 
+def _iter_rss_items_lxml(xml_content: str) -> List[Dict[str, str]]:
+    """
+    lxml 路径：流式解析 RSS XML，返回每个 item 的原始字段
+
+    iterparse 逐个产出 </item> 事件并在处理后释放节点，
+    整个 feed 不会同时驻留在内存中。
+
+    参数:
+        xml_content: RSS XML 字符串
+
+    返回:
+        List[Dict]: 每个 item 的 title/description/link/guid/pubDate 原始文本
+    """
+    items = []
+    source = io.BytesIO(xml_content.encode("utf-8"))
+    for _, item in etree.iterparse(source, events=("end",), tag="item", recover=True):
+        items.append({
+            "title": (item.findtext("title") or "").strip(),
+            "description": (item.findtext("description") or "").strip(),
+            "link": (item.findtext("link") or "").strip(),
+            "guid": (item.findtext("guid") or "").strip(),
+            "pubDate": (item.findtext("pubDate") or "").strip(),
+        })
+        # 流式解析的标准做法：清掉已处理的节点和前面的兄弟节点，释放内存
+        item.clear(keep_tail=False)
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    return items
+
+
+def _iter_rss_items_et(xml_content: str) -> List[Dict[str, str]]:
+    """
+    标准库路径：用 ElementTree.iterparse（expat C 解析器）流式提取 item 字段
+
+    没有 lxml 时的次选；遇到不合法的 XML 抛出 ET.ParseError，由调用方回退到正则。
+
+    参数:
+        xml_content: RSS XML 字符串
+
+    返回:
+        List[Dict]: 每个 item 的 title/description/link/guid/pubDate 原始文本
+    """
+    items = []
+    source = io.BytesIO(xml_content.encode("utf-8"))
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag != "item":
+            continue
+        items.append({
+            "title": (elem.findtext("title") or "").strip(),
+            "description": (elem.findtext("description") or "").strip(),
+            "link": (elem.findtext("link") or "").strip(),
+            "guid": (elem.findtext("guid") or "").strip(),
+            "pubDate": (elem.findtext("pubDate") or "").strip(),
+        })
+        # 清空已处理的节点，保持流式解析的内存占用
+        elem.clear()
+    return items
+
+
+def _iter_rss_items_regex(xml_content: str) -> List[Dict[str, str]]:
+    """
+    正则回退路径：逐字段正则提取每个 item 的原始字段
+
+    参数:
+        xml_content: RSS XML 字符串
+
+    返回:
+        List[Dict]: 每个 item 的 title/description/link/guid/pubDate 原始文本
+    """
+    items = []
+    # 外层的 <item> 边界用 str.find 定位（C 级子串搜索），
+    # 不必让 DOTALL 正则扫一遍整个 feed
+    pos = 0
+    while True:
+        start = xml_content.find('<item>', pos)
+        if start < 0:
+            break
+        end = xml_content.find('</item>', start)
+        if end < 0:
+            break
+        item_content = xml_content[start + len('<item>'):end]
+        pos = end + len('</item>')
+
+        # 一次扫描同时提取全部字段；CDATA 包装由 extract_cdata_content 统一剥掉
+        found = {m.group(1): extract_cdata_content(m.group(2))
+                 for m in _FIELDS_RE.finditer(item_content)}
+        items.append({field: found.get(field, "") for field in _ITEM_FIELDS})
+    return items
+
+
+@functools.lru_cache(maxsize=2048)
+def _strip_html(text: str) -> str:
+    """
+    去除文本中的 HTML 标签（重复的描述文本直接命中缓存）
+
+    优先使用 lxml 的 C 词法器取纯文本（对畸形标签更稳健），
+    未安装或解析失败时回退到标签正则替换。
+
+    参数:
+        text: 可能包含 HTML 标签的文本
+
+    返回:
+        去除标签后的纯文本
+    """
+    if _HTML_PARSER is not None:
+        try:
+            node = etree.fromstring(f"<d>{text}</d>", parser=_HTML_PARSER)
+            if node is not None:
+                return node.xpath("string()").strip()
+        except Exception:
+            pass
+    return _TAG_RE.sub('', text).strip()
+
+
+def _extract_item_columns(fields: Dict[str, str]) -> Optional[tuple]:
+    """
+    由单个 item 的原始字段提取模型的各列值
+
+    参数:
+        fields: item 的 title/description/link/guid/pubDate 原始文本
+
+    返回:
+        (model_id, name, provider, description, link, pub_date) 元组，
+        可选字段缺失时为空字符串；无法确定模型 ID 时返回 None
+    """
+    title = fields["title"]
+
+    # 从 title 中提取信息，格式通常是: "提供商: 模型名称 (模型ID)"
+    # 例如: "Google: Gemini 3 Flash Preview (google/gemini-3-flash-preview)"
+    provider = ""
+    model_name = ""
+    model_id = ""
+
+    if title:
+        match = _TITLE_RE.match(title)
+        if match:
+            provider = (match.group('prov') or '').strip()
+            model_name = match.group('name').strip()
+            model_id = match.group('mid').strip()
+        else:
+            # 没有匹配到任何带ID的格式，整个 title 作为名称
+            model_name = title.strip()
+
+    # 移除 description 中的 HTML 标签
+    description = fields["description"]
+    if description:
+        description = _strip_html(description)
+
+    link = fields["link"]
+
+    # 从 link 中提取模型ID（如果 title 中没有）
+    if not model_id and link:
+        link_match = _LINK_ID_RE.search(link)
+        if link_match:
+            model_id = link_match.group(1)
+
+    # 如果还没有ID，尝试从guid中提取
+    if not model_id and fields["guid"]:
+        guid_match = _GUID_ID_RE.search(fields["guid"])
+        if guid_match:
+            model_id = guid_match.group(1)
+
+    if not model_id:
+        return None
+
+    return model_id, model_name or model_id, provider, description, link, fields["pubDate"]
+
+
 def parse_rss_xml(xml_content: str) -> List[Dict[str, Any]]:
     """
     解析 RSS XML 内容，提取模型信息
-    
+
+    优先使用 lxml 的流式解析，未安装或解析失败时回退到正则提取。
+
     参数:
         xml_content: RSS XML 字符串
-        
+
     返回:
         List[Dict]: 包含模型关键信息的列表
     """
+    # 错误页 / 空响应直接拒绝，C 级子串检查远快于进入解析器
+    if not xml_content or "<item>" not in xml_content:
+        logger.warning("RSS 内容中没有找到任何模型项")
+        return []
+    if "</rss>" not in xml_content:
+        # feed 可能被截断，仍尝试解析完整的条目
+        logger.warning("RSS 内容可能被截断（缺少 </rss> 结尾）")
+
     models = []
     seen_models = set()
-    
+
     try:
-        # 使用正则表达式提取所有 item 块
-        item_pattern = r'<item>(.*?)</item>'
-        item_matches = re.findall(item_pattern, xml_content, re.DOTALL)
-        logger.info(f"找到 {len(item_matches)} 个模型项")
-        
-        for item_content in item_matches:
+        items = None
+        if etree is not None:
             try:
-                # 提取 title
-                title_match = re.search(r'<title>(.*?)</title>', item_content, re.DOTALL)
-                title = ""
-                if title_match:
-                    title = extract_cdata_content(title_match.group(1))
-                
-                # 从 title 中提取信息，格式通常是: "提供商: 模型名称 (模型ID)"
-                # 例如: "Google: Gemini 3 Flash Preview (google/gemini-3-flash-preview)"
-                provider = ""
-                model_name = ""
-                model_id = ""
-                
-                if title:
-                    # 解析 title 格式
-                    # 匹配格式: "提供商: 模型名称 (模型ID)"
-                    match = re.match(r'^([^:]+):\s*(.+?)\s*\(([^)]+)\)$', title)
-                    if match:
-                        provider = match.group(1).strip()
-                        model_name = match.group(2).strip()
-                        model_id = match.group(3).strip()
-                    else:
-                        # 如果没有匹配到标准格式，尝试其他格式
-                        # 可能只有模型名称和ID
-                        match = re.match(r'^(.+?)\s*\(([^)]+)\)$', title)
-                        if match:
-                            model_name = match.group(1).strip()
-                            model_id = match.group(2).strip()
-                        else:
-                            model_name = title.strip()
-                
-                # 提取 description
-                desc_match = re.search(r'<description>(.*?)</description>', item_content, re.DOTALL)
-                description = ""
-                if desc_match:
-                    description = extract_cdata_content(desc_match.group(1))
-                    # 移除 HTML 标签
-                    description = re.sub(r'<[^>]+>', '', description)
-                    description = description.strip()
-                
-                # 提取 link
-                link_match = re.search(r'<link>(.*?)</link>', item_content, re.DOTALL)
-                link = ""
-                if link_match:
-                    link = link_match.group(1).strip()
-                
-                # 从 link 中提取模型ID（如果 title 中没有）
-                if not model_id and link:
-                    # link 格式: https://openrouter.ai/provider/model-id
-                    link_match = re.search(r'openrouter\.ai/([^/]+/[^/]+)', link)
-                    if link_match:
-                        model_id = link_match.group(1)
-                
-                # 提取 guid
-                guid_match = re.search(r'<guid[^>]*>(.*?)</guid>', item_content, re.DOTALL)
-                guid = ""
-                if guid_match:
-                    guid = guid_match.group(1).strip()
-                
-                # 提取 pubDate
-                pub_date_match = re.search(r'<pubDate>(.*?)</pubDate>', item_content, re.DOTALL)
-                pub_date = ""
-                if pub_date_match:
-                    pub_date = pub_date_match.group(1).strip()
-                
-                # 去重：使用模型ID作为唯一标识
-                if not model_id:
-                    # 如果没有ID，尝试从guid中提取
-                    if guid:
-                        # guid 格式可能是: "provider/model-id-date" 或 "provider/model-id"
-                        guid_match = re.search(r'([^/]+/[^/-]+)', guid)
-                        if guid_match:
-                            model_id = guid_match.group(1)
-                
-                if not model_id:
-                    continue
-                
-                model_key = model_id.lower()
-                if model_key in seen_models:
-                    continue
-                seen_models.add(model_key)
-                
-                # 构建模型信息
-                model_info = {
-                    "id": model_id,
-                    "name": model_name or model_id,
-                }
-                
-                if provider:
-                    model_info["provider"] = provider
-                
-                if description:
-                    model_info["description"] = description
-                
-                if link:
-                    model_info["link"] = link
-                
-                if pub_date:
-                    model_info["pub_date"] = pub_date
-                
-                models.append(model_info)
-                
+                items = _iter_rss_items_lxml(xml_content)
             except Exception as e:
-                logger.warning(f"解析模型项时出错: {str(e)}")
+                logger.warning(f"lxml 解析失败，回退到标准库解析: {str(e)}")
+        if items is None:
+            try:
+                items = _iter_rss_items_et(xml_content)
+            except ET.ParseError as e:
+                # 有些 RSS 端点会输出不合法的 XML，此时退到宽容的正则提取
+                logger.warning(f"XML 解析失败，回退到正则解析: {str(e)}")
+        if items is None:
+            items = _iter_rss_items_regex(xml_content)
+        logger.info(f"找到 {len(items)} 个模型项")
+
+        # SoA（列存）布局：解析阶段只向六个平行列表追加，
+        # 每个模型的字典推迟到返回前一次性物化，避免逐条字典分配与扩容
+        ids, names, providers, descriptions, links, pub_dates = [], [], [], [], [], []
+        # 字段提取内部对每个可能缺失的值都有 if 守卫，缺字段只会得到
+        # 空字符串而不会抛异常，循环体保持无异常机制的直线代码
+        for fields in items:
+            columns = _extract_item_columns(fields)
+            if columns is None:
                 continue
-        
+            model_id, name, provider, description, link, pub_date = columns
+
+            # 去重：使用模型ID作为唯一标识。ID 已是小写时跳过 casefold 的
+            # 新字符串分配；intern 让重复出现的 ID 在整个运行期只存一份
+            model_key = sys.intern(model_id if model_id.islower() else model_id.casefold())
+            if model_key in seen_models:
+                continue
+            seen_models.add(model_key)
+
+            ids.append(model_id)
+            names.append(name)
+            providers.append(provider)
+            descriptions.append(description)
+            links.append(link)
+            pub_dates.append(pub_date)
+
+        # 物化为字典列表，空的可选字段不写入
+        for model_id, name, provider, description, link, pub_date in zip(
+                ids, names, providers, descriptions, links, pub_dates):
+            model_info = {"id": model_id, "name": name}
+            for key, value in (("provider", provider), ("description", description),
+                               ("link", link), ("pub_date", pub_date)):
+                if value:
+                    model_info[key] = value
+            models.append(model_info)
+
         logger.info(f"成功解析 {len(models)} 个模型")
-        
+
     except Exception as e:
-        logger.error(f"处理 RSS XML 时出错: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"处理 RSS XML 时出错: {str(e)}")
         return []
-    
+
     return models
 
 
-async def fetch_openrouter_models() -> List[Dict[str, Any]]:
+async def _fetch_rss_via_request(browser_context) -> Any:
     """
-    从 OpenRouter RSS 页面获取模型信息
-    
+    通过浏览器上下文的 request API 直接请求 RSS 原文
+
+    跳过页面导航、渲染和 outerHTML 序列化，直接拿到未经实体编码的 XML。
+
+    参数:
+        browser_context: 共享的浏览器上下文
+
     返回:
-        List[Dict]: 包含模型关键信息的列表
+        RSS XML 字符串，请求失败时返回 None
     """
-    models = []
-    playwright = None
-    
     try:
-        # 连接到浏览器
-        playwright, browser_context, page = await connect_to_browser()
-        if not playwright or not browser_context or not page:
-            logger.error("无法连接到浏览器，退出")
-            return []
-        
+        logger.info(f"正在请求: {OPENROUTER_RSS_URL}")
+        response = await browser_context.request.get(OPENROUTER_RSS_URL, timeout=PAGE_LOAD_TIMEOUT)
+        if not response.ok:
+            logger.warning(f"RSS 请求返回状态 {response.status}，回退到页面导航")
+            return None
+        return await response.text()
+    except Exception as e:
+        logger.warning(f"RSS 直接请求失败，回退到页面导航: {str(e)}")
+        return None
+
+
+async def _fetch_rss_via_page(browser_context) -> Any:
+    """
+    回退路径：用页面导航加载 RSS 并从 outerHTML 中抠出 XML
+
+    浏览器会把 XML 包进 HTML 查看器（通常在 <pre> 标签里）并做实体编码，
+    需要逐级尝试 <pre> / 原始 XML / <body> 提取。
+
+    参数:
+        browser_context: 共享的浏览器上下文
+
+    返回:
+        RSS XML 字符串，失败时返回 None
+    """
+    page = None
+    try:
+        page = await browser_context.new_page()
+        page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+
         logger.info(f"正在访问: {OPENROUTER_RSS_URL}")
-        try:
-            await page.goto(OPENROUTER_RSS_URL, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT)
-            await asyncio.sleep(PAGE_LOAD_WAIT_TIME)  # 等待页面完全加载
-        except Exception as e:
-            logger.error(f"访问页面失败: {str(e)}")
-            raise
-        
-        # 获取页面的 outerHTML
-        logger.info("正在获取页面的 outerHTML...")
-        outer_html = await page.evaluate("() => document.documentElement.outerHTML")
-        
+        # 纯 XML 端点没有后续子资源，domcontentloaded 即表示文档就绪，
+        # 不必等 networkidle 的静默窗口
+        response = await page.goto(OPENROUTER_RSS_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
+        if response is not None and not response.ok:
+            logger.error(f"页面返回状态 {response.status}")
+            return None
+
+        # 获取页面 HTML；page.content() 是单个现成的 CDP 调用，
+        # 不用像 evaluate 那样传输并执行 JS 再序列化返回值
+        logger.info("正在获取页面 HTML...")
+        outer_html = await page.content()
+
         if not outer_html:
-            logger.error("未获取到 outerHTML")
-            return []
-        
-        logger.debug(f"获取到 outerHTML，长度: {len(outer_html)}")
-        
+            logger.error("未获取到页面 HTML")
+            return None
+
+        logger.debug(f"获取到页面 HTML，长度: {len(outer_html)}")
+
         # 从 outerHTML 中提取 XML 内容
         # RSS XML 可能在 <pre> 标签中，或者直接是页面的内容
         # 首先尝试查找 <pre> 标签
@@ -218,7 +388,6 @@ async def fetch_openrouter_models() -> List[Dict[str, Any]]:
         if pre_match:
             xml_content = pre_match.group(1)
             # 解码 HTML 实体
-            import html
             xml_content = html.unescape(xml_content)
         else:
             # 如果没有 <pre> 标签，尝试直接提取 XML
@@ -231,29 +400,56 @@ async def fetch_openrouter_models() -> List[Dict[str, Any]]:
                 body_match = re.search(r'<body[^>]*>(.*?)</body>', outer_html, re.DOTALL)
                 if body_match:
                     xml_content = body_match.group(1)
-                    import html
                     xml_content = html.unescape(xml_content)
                 else:
                     # 最后尝试使用整个 HTML 内容
                     xml_content = outer_html
-        
-        # 解析 RSS XML
-        models = parse_rss_xml(xml_content)
-        
+
+        return xml_content
     except Exception as e:
-        logger.error(f"获取模型信息过程中出错: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return []
+        logger.error(f"页面方式获取 RSS 失败: {str(e)}")
+        return None
     finally:
-        # 通过 CDP 连接时，只停止 playwright 实例，不关闭浏览器
-        if playwright:
+        # 只关闭本任务的页面，共享的 playwright 实例由 shutdown_shared_browser 统一停止
+        if page:
             try:
-                await playwright.stop()
+                await page.close()
             except Exception as e:
-                logger.warning(f"停止 playwright 时出错: {e}")
-    
-    return models
+                logger.warning(f"关闭页面时出错: {e}")
+
+
+async def fetch_openrouter_models() -> List[Dict[str, Any]]:
+    """
+    从 OpenRouter RSS 页面获取模型信息
+
+    优先通过浏览器上下文的 request API 直接请求 RSS 原文，
+    失败时回退到页面导航并从 outerHTML 中提取 XML。
+
+    返回:
+        List[Dict]: 包含模型关键信息的列表
+    """
+    try:
+        # 获取共享的浏览器上下文
+        browser_context = await get_shared_context()
+        if not browser_context:
+            logger.error("无法连接到浏览器，退出")
+            return []
+
+        xml_content = await _fetch_rss_via_request(browser_context)
+        if xml_content is None:
+            xml_content = await _fetch_rss_via_page(browser_context)
+
+        if not xml_content:
+            logger.error("未获取到 RSS 内容")
+            return []
+
+        # 在工作线程中解析 RSS XML，解析期间事件循环可继续处理
+        # 其他抓取任务的网络事件与 Playwright 的清理工作
+        return await asyncio.to_thread(parse_rss_xml, xml_content)
+
+    except Exception as e:
+        logger.exception(f"获取模型信息过程中出错: {str(e)}")
+        return []
 
 
 async def main():
@@ -277,8 +473,7 @@ async def main():
                         "models": models
                     }
                     
-                    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-                        json.dump(output_data, f, ensure_ascii=False, indent=2)
+                    write_json_file(OUTPUT_FILE, output_data)
                     logger.success(f"成功保存 {len(models)} 个模型信息到 {OUTPUT_FILE}")
                 except Exception as e:
                     logger.error(f"保存文件失败: {str(e)}")
@@ -289,8 +484,13 @@ async def main():
                 logger.info(f"  总模型数: {len(models)}")
                 logger.info(f"  模型列表页: {output_data['models_page']}")
                 logger.info(f"  API Key 管理页: {output_data['api_key_page']}")
-                models_with_provider = sum(1 for m in models if m.get("provider"))
-                models_with_description = sum(1 for m in models if m.get("description"))
+                # 一次遍历同时统计两个计数
+                models_with_provider = models_with_description = 0
+                for m in models:
+                    if m.get("provider"):
+                        models_with_provider += 1
+                    if m.get("description"):
+                        models_with_description += 1
                 logger.info(f"  有提供商的模型: {models_with_provider}")
                 logger.info(f"  有描述的模型: {models_with_description}")
                 logger.info("=" * 60)
@@ -312,20 +512,24 @@ async def main():
             else:
                 logger.warning("未获取到任何 OpenRouter 模型信息")
         except Exception as e:
-            logger.error(f"获取 OpenRouter 模型失败: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"获取 OpenRouter 模型失败: {str(e)}")
             raise
         
     except KeyboardInterrupt:
         logger.warning("\n用户中断程序")
         raise
     except Exception as e:
-        logger.error(f"程序执行失败: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"程序执行失败: {str(e)}")
         raise
 
 
+async def _standalone():
+    """单独运行本模块时，结束后停止共享的 playwright 实例"""
+    try:
+        await main()
+    finally:
+        await shutdown_shared_browser()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_standalone())